@@ -74,13 +74,13 @@ utime.sleep(1)
 
 print("Turning all LEDs off in sequence...")
 
-led_controller.led3 = False
+led_controller.set_led3(0)
 utime.sleep(1)
-led_controller.led2 = False
+led_controller.set_led2(0)
 utime.sleep(1)
-led_controller.led1 = False
+led_controller.set_led1(0)
 utime.sleep(1)
-led_controller.led0 = False
+led_controller.set_led0(0)
 utime.sleep(1)
 
 ##
@@ -97,6 +97,16 @@ for index in range(1, 10):
 
     utime.sleep(1)
 
+##
+## Rotate the lights: setting all the LEDs in one call from the bits of a mask
+##
+
+print("Rotating the lights for 10 seconds...")
+
+for index in range(40):
+    led_controller.set_state_mask(1 << (index % 4))
+    utime.sleep_ms(250)
+
 ##
 ## Turn all LEDs off
 ##
@@ -63,7 +63,7 @@ import utime
 ##
 
 # Instantiate the SPI interface
-spi_controller = SPI(0, 100000, mosi=Pin(19), sck=Pin(18))
+spi_controller = SPI(0, 6600000, mosi=Pin(19), sck=Pin(18))
 
 # Add the pins required by the display controller
 data_cmd_pin = Pin(15, Pin.OUT)
@@ -405,8 +405,8 @@ class Canvas(ABC):
 
     @x_y.setter
     def x_y(self, xy: tuple) -> None:
-        self.cursor.x = int(xy[0])
-        self.cursor.y = int(xy[1])
+        self.cursor.x = xy[0]
+        self.cursor.y = xy[1]
 
     @property
     def cursor(self) -> graphics.BoundPixel:
@@ -572,16 +572,18 @@ class Canvas(ABC):
         postion if `start` is `None`. In either case the rectangle will be drawn
         to the specified `height` and `width`, using the either the specified or
         `Canvas` `fg_colour` for the frame of the rectangle. If the `style` is
-        `"FILLED"` then  either the specified `bg_colour` or `Canvas`
-        `bg_colour` as the interior colour. If the `style` is `"FRAMED"` then
-        the interior of the rectangle is not drawn.
+        `RECTANGLE_STYLE.FILLED` then  either the specified `bg_colour` or
+        `Canvas` `bg_colour` as the interior colour. If the `style` is
+        `RECTANGLE_STYLE.FRAMED` then the interior of the rectangle is not
+        drawn.
 
         See either [`select_fg_colour`]
         [lbutils.graphics.Canvas.select_fg_colour] for more details of the
         foreground colour selection algorithm; or [`select_bg_colour`]
         [lbutils.graphics.Canvas.select_bg_colour] for more details of the
         background colour selection algorithm. By default the rectangle is
-        `"FILLED"` and so both the background and foreground colours are used.
+        `RECTANGLE_STYLE.FILLED` and so both the background and foreground
+        colours are used.
 
         Parameters
         ----------
@@ -820,8 +822,10 @@ class Canvas(ABC):
             # Now write the string. Note that we set the `start`
             # of the `write_char()` method to `None` to hand control
             # of the cursor to that method.
+            write_char = self.write_char
+
             for character in txt_str:
-                self.write_char(
+                write_char(
                     start=None,
                     utf8_char=character,
                     fg_colour=fg_colour,
@@ -884,15 +888,18 @@ class Canvas(ABC):
         self.font.set_position(utf8_char)
         _offset, _width, _height, _cursor, x_off, y_off = self.font.current_glyph
 
-        # Draw the glyph at the current cursor position
+        # Draw the glyph at the current cursor position. The methods and
+        # co-ordinates used in the loop are bound to locals, to avoid the
+        # repeated attribute look-ups for each pixel
+        get_next = self.font.get_next
+        write_pixel = self.write_pixel
+        x0 = self.cursor.x + x_off
+        y0 = self.cursor.y + y_off
+
         for y1 in range(_height):
             for x1 in range(_width):
-                if self.font.get_next():
-                    self.write_pixel(
-                        self.cursor.x + x1 + x_off,
-                        self.cursor.y + y1 + y_off,
-                        use_fg_colour,
-                    )
+                if get_next():
+                    write_pixel(x0 + x1, y0 + y1, use_fg_colour)
 
         # Move the cursor to the `x` position at the end of the glyph.
         # This is also where the next character should be drawn
@@ -161,6 +161,24 @@ class Colour:
         constructor the behaviour of the class is undefined.
     """
 
+    ##
+    ## Attribute Slots. Fixes the attributes of each instance, avoiding the
+    ## creation of a `__dict__` for every `Colour`. Note that some MicroPython
+    ## ports ignore `__slots__`, in which case this is harmless
+    ##
+
+    __slots__ = (
+        "word_order",
+        "_r",
+        "_g",
+        "_b",
+        "_565",
+        "_888",
+        "_red",
+        "_green",
+        "_blue",
+    )
+
     ##
     ## Internal Attributes
     ##
@@ -172,9 +190,9 @@ class Colour:
     _565: Optional[int]
     _888: Optional[int]
 
-    _red: Optional[int]
-    _green: Optional[int]
-    _blue: Optional[int]
+    _red: int
+    _green: int
+    _blue: int
 
     ##
     ## Constructors
@@ -218,12 +236,15 @@ class Colour:
         # the bytes in the words
         self.word_order = word_order
 
+        # Single byte channel values, which are read for every drawing
+        # operation and so are calculated once here
+        self._red = self._r & 0xFF
+        self._green = self._g & 0xFF
+        self._blue = self._b & 0xFF
+
         # Cached values
         self._565 = None
         self._888 = None
-        self._red = None
-        self._green = None
-        self._blue = None
 
     ##
     ## Properties
@@ -232,25 +253,16 @@ class Colour:
     @property
     def red(self) -> int:
         """The red component of the colour value, packed to a single byte."""
-        if self._red is None:
-            self._red = self._r & 0xFF
-
         return self._red
 
     @property
     def green(self) -> int:
         """The green component of the colour value, packed to a single byte."""
-        if self._green is None:
-            self._green = self._g & 0xFF
-
         return self._green
 
     @property
     def blue(self) -> int:
         """The blue component of the colour value, packed to a single byte."""
-        if self._blue is None:
-            self._blue = self._b & 0xFF
-
         return self._blue
 
     @property
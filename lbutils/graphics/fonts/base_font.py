@@ -96,6 +96,9 @@ class BaseFont:
     being displayed, and then advance the internal cursor to
     the next position: ready for the next call.
 
+    * `get_raw()`. Return the (packed) bitmap bytes of the current glyph,
+    without decoding the individual bits.
+
     * `set_position()`. Set the internal state to draw the glyph of the character
     in the next natural position.
     """
@@ -212,3 +215,24 @@ class BaseFont:
         self.position = self.position + 1
 
         return flag
+
+    def get_raw(self) -> memoryview:
+        """Return the bitmap of the glyph selected by the last call to
+        [`set_position`][lbutils.graphics.fonts.base_font.BaseFont.set_position]
+        as a `memoryview` of the underlying font `bitmap`. The bits of the glyph
+        are packed row-by-row with the most significant bit first, and so can
+        be decoded directly by the caller without the overhead of repeated calls
+        to [`get_next`][lbutils.graphics.fonts.base_font.BaseFont.get_next].
+
+        Returns
+        -------
+
+        memoryview
+            The bytes of the `bitmap` holding the current glyph. Bits beyond
+            the `width` x `height` of the glyph in the final byte should be
+            ignored.
+        """
+
+        offset, width, height = self.current_glyph[0:3]
+
+        return memoryview(self.bitmap)[offset : offset + (width * height + 7) // 8]
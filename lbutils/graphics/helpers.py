@@ -34,11 +34,42 @@ The classes and methods provided by this library are described below, and organi
 *   CPython (3.10)
 """
 
+# Import the typing hints if available. Use our backup version
+# if the official library is missing
+try:
+    from typing import Iterator
+except ImportError:
+    from lbutils.std.typing import Iterator  # type: ignore
+
 # Import the math library (needed for polar co-ordinates)
 from math import cos, sin
 
 from .colours import COLOUR_BLACK, COLOUR_WHITE, Colour
 
+###
+### Module Attributes
+###
+
+# Cache of the (cosine, sine) look-up tables used by `Pixel.sweep_polar`,
+# keyed by the tuple of angles used to build each table
+_SWEEP_LUTS: dict = {}
+
+# Maximum number of look-up tables held in `_SWEEP_LUTS`. The cache is
+# cleared when full, so callers sweeping over many different tuples of angles
+# cannot grow the cache without limit
+_SWEEP_LUT_CACHE_SIZE = 4
+
+###
+### Functions
+###
+
+
+def _toint(value: int) -> int:
+    """Return `value` as an `int`, only calling `int()` if `value` is not
+    already an integer (the common case for the drawing routines)."""
+    return value if type(value) is int else int(value)
+
+
 ###
 ### Classes
 ###
@@ -140,6 +171,8 @@ class Pixel:
     current `Pixel` with the specified Cartesian off-set applied.
     * `offset_polar()`. Returns a `tuple` representing the (x, y) co-ordinate of
     the current `Pixel` with the specified Polar off-set applied.
+    * `sweep_polar()`. Returns the (x, y) co-ordinates of the current `Pixel`
+    with a Polar off-set applied for each angle in a (fixed) sequence of angles.
     """
 
     ##
@@ -165,8 +198,8 @@ class Pixel:
         y: int
                 The initial Y co-ordinate value.
         """
-        self.x = int(x)
-        self.y = int(y)
+        self.x = x
+        self.y = y
 
     ##
     ## Properties
@@ -195,8 +228,8 @@ class Pixel:
 
     @x_y.setter
     def x_y(self, xy: tuple[int, int]) -> None:
-        self.x = int(xy[0])
-        self.y = int(xy[1])
+        self.x = xy[0]
+        self.y = xy[1]
 
     ##
     ## Properties
@@ -209,7 +242,7 @@ class Pixel:
 
     @x.setter
     def x(self, value: int) -> None:
-        self._x = int(value)
+        self._x = _toint(value)
 
     @property
     def y(self) -> int:
@@ -218,7 +251,7 @@ class Pixel:
 
     @y.setter
     def y(self, value: int) -> None:
-        self._y = int(value)
+        self._y = _toint(value)
 
     ##
     ## Methods
@@ -346,6 +379,84 @@ class Pixel:
         """
         return (int(self.x + (r * cos(theta))), int(self.y + (r * sin(theta))))
 
+    def sweep_polar(self, r: int, thetas: tuple) -> Iterator[tuple[int, int]]:
+        """Return the (x, y) co-ordinates of the current `Pixel`, with a Polar
+        off-set of radius `r` applied for each angle in the tuple of `thetas`.
+        The co-ordinates are returned in the same order as the angles in
+        `thetas`.
+
+        Unlike [`offset_polar`][lbutils.graphics.Pixel.offset_polar], the
+        sine and cosine of each angle are only calculated on the _first_ call
+        for a given tuple of `thetas`, and are then cached. This makes
+        `sweep_polar` suitable for drawing routines which repeatedly sweep
+        over the same angles: for instance the corners of a rounded
+        rectangle drawn on each frame.
+
+        !!! note "Re-use the Same Angles"
+            The cache is keyed by the tuple of `thetas`, so the angles must be
+            passed as a `tuple` (not a `list`). Only a few tables are held at
+            once, so define the tuple of angles once (e.g. as a module
+            constant) and pass the same tuple on each call to avoid
+            re-building the table.
+
+        Example
+        -------
+
+        Given a `Pixel` object called `centre` representing the co-ordinates
+        '(20, 20)', the corners of a square of 'radius' 10 can be found as
+
+        ````python
+        CORNERS = (0.785, 2.356, 3.927, 5.498)
+
+        centre = Pixel(20, 20)
+        for corner in centre.sweep_polar(10, CORNERS):
+            print(corner)
+        ````
+
+        Parameters
+        ----------
+
+        r: int
+            The _radius_ of the Polar co-ordinate off-set to apply to each
+            angle.
+        thetas: tuple
+            The _angles_ of the Polar co-ordinate off-sets to apply.
+
+        Returns
+        -------
+
+        Iterator:
+            The (x, y) co-ordinate as a two value `tuple` for each angle in
+            `thetas`, with the first value of the `tuple` representing the `x`
+            co-ordinate and the second value of the `tuple` representing the
+            `y` co-ordinate.
+        """
+        x = self.x
+        y = self.y
+
+        for c, s in Pixel._build_sweep_lut(thetas):
+            yield (int(x + r * c), int(y + r * s))
+
+    ##
+    ## Private (Non-Public) Methods
+    ##
+
+    @staticmethod
+    def _build_sweep_lut(thetas: tuple) -> tuple:
+        """Return the look-up table of (cosine, sine) pairs for the angles in
+        `thetas`, building (and caching) the table on the first call."""
+        lut = _SWEEP_LUTS.get(thetas)
+
+        if lut is None:
+            lut = tuple((cos(theta), sin(theta)) for theta in thetas)
+
+            if len(_SWEEP_LUTS) >= _SWEEP_LUT_CACHE_SIZE:
+                _SWEEP_LUTS.clear()
+
+            _SWEEP_LUTS[thetas] = lut
+
+        return lut
+
 
 class BoundPixel(Pixel):
     """Represents a Cartesian co-ordinate between limits. Used as a convenience
@@ -452,8 +563,8 @@ class BoundPixel(Pixel):
 
         # Now attempt to set the actual `x` and `y` inside those
         # parameters
-        self.x = int(x)
-        self.y = int(y)
+        self.x = x
+        self.y = y
 
     ##
     ## Properties
@@ -479,13 +590,7 @@ class BoundPixel(Pixel):
 
     @x.setter
     def x(self, value: int) -> None:
-        if self.min_x <= value <= self.max_x:
-            self._x = value
-        else:
-            if value > self.max_x:
-                self._x = self.max_x
-            if value < self.min_x:
-                self._x = self.min_x
+        self._x = min(max(_toint(value), self.min_x), self.max_x)
 
     @property
     def y(self) -> int:
@@ -507,10 +612,4 @@ class BoundPixel(Pixel):
 
     @y.setter
     def y(self, value: int) -> None:
-        if self.min_y <= value <= self.max_y:
-            self._y = value
-        else:
-            if value > self.max_y:
-                self._y = self.max_y
-            if value < self.min_y:
-                self._y = self.min_y
+        self._y = min(max(_toint(value), self.min_y), self.max_y)
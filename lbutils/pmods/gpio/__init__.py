@@ -30,4 +30,4 @@ modules](https://digilent.com/reference/pmod/start).
 __all__ = ["led"]
 
 from .common import PMOD_ROW
-from .led import LED
+from .led import LED, set_states_bulk
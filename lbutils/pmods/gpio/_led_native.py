@@ -0,0 +1,55 @@
+# This module, and all included code, is made available under the terms of the
+# MIT Licence
+#
+# Copyright (c) 2023 David Love
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Native code (Viper) implementation of the GPIO register writes used by the
+[`LED`][lbutils.pmods.gpio.led.LED] driver. This is kept in a separate module
+as the Viper code emitter is not available on every port of MicroPython: and a
+module using the `@micropython.viper` decorator will not compile on those
+ports. The [`LED`][lbutils.pmods.gpio.led.LED] driver falls back to an
+equivalent Python version if this module cannot be imported.
+
+This module is not meant to be used directly by end-user code.
+"""
+
+# Allow the use of MicroPython constants, and the code emitters
+import micropython
+from micropython import const
+
+##
+## RP2040 Single-cycle IO (SIO) Registers. See the RP2040 datasheet, section
+## 2.3.1.7
+##
+
+_SIO_GPIO_OUT_SET = const(0xD0000014)
+_SIO_GPIO_OUT_CLR = const(0xD0000018)
+
+###
+### Functions
+###
+
+
+@micropython.viper
+def _sio_write(set_mask: int, clr_mask: int) -> None:
+    """Set the GPIO outputs given by `set_mask`, and clear the GPIO outputs
+    given by `clr_mask`, using the RP2040 SIO registers. Only called on the
+    RP2040 chip: see `_HAS_SIO` in [`led`][lbutils.pmods.gpio.led]."""
+    ptr32(_SIO_GPIO_OUT_SET)[0] = set_mask  # type: ignore  # noqa: F821
+    ptr32(_SIO_GPIO_OUT_CLR)[0] = clr_mask  # type: ignore  # noqa: F821
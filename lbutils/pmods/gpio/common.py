@@ -39,6 +39,40 @@ try:
 except ImportError:
     from lbutils.std.enum import IntEnum  # type: ignore
 
+# Allow the use of MicroPython constants. On other platforms the constants
+# are simply left as integers
+try:
+    from micropython import const
+except ImportError:
+
+    def const(value: int) -> int:  # type: ignore
+        return value
+
+
+###
+### Constants
+###
+
+##
+## Pmod Header Rows and Pin Assignments. These are defined as module level
+## integers, which MicroPython will fold into the bytecode of this module
+## as literals. The enumerations below provide the same values by name for
+## backwards compatibility.
+##
+
+PMOD_ROW_UPPER = const(0)
+PMOD_ROW_LOWER = const(1)
+
+PMOD_PIN_UPPER_GPIO0 = const(17)
+PMOD_PIN_UPPER_GPIO1 = const(19)
+PMOD_PIN_UPPER_GPIO2 = const(0)
+PMOD_PIN_UPPER_GPIO3 = const(18)
+
+PMOD_PIN_LOWER_GPIO0 = const(14)
+PMOD_PIN_LOWER_GPIO1 = const(0)
+PMOD_PIN_LOWER_GPIO2 = const(22)
+PMOD_PIN_LOWER_GPIO3 = const(0)
+
 ###
 ### Enumerations
 ###
@@ -48,25 +82,25 @@ class PMOD_ROW(IntEnum):
     """Sets row to use in the Pmod header for GPIO devices which use only 6 of
     the available 12 pins (i.e. 4 of the 8 possible GPIO pins)'."""
 
-    UPPER = 0
-    LOWER = 1
+    UPPER = PMOD_ROW_UPPER
+    LOWER = PMOD_ROW_LOWER
 
 
 class PMOD_PIN_UPPER(IntEnum):
     """Defines the default pin assignment for a GPIO module using the upper row
     of pins on a Pmod module."""
 
-    GPIO0 = 17
-    GPIO1 = 19
-    GPIO2 = 0
-    GPIO3 = 18
+    GPIO0 = PMOD_PIN_UPPER_GPIO0
+    GPIO1 = PMOD_PIN_UPPER_GPIO1
+    GPIO2 = PMOD_PIN_UPPER_GPIO2
+    GPIO3 = PMOD_PIN_UPPER_GPIO3
 
 
 class PMOD_PIN_LOWER(IntEnum):
     """Defines the default pin assignment for a GPIO module using the lower row
     of pins on a Pmod module."""
 
-    GPIO0 = 14
-    GPIO1 = 0
-    GPIO2 = 22
-    GPIO3 = 0
+    GPIO0 = PMOD_PIN_LOWER_GPIO0
+    GPIO1 = PMOD_PIN_LOWER_GPIO1
+    GPIO2 = PMOD_PIN_LOWER_GPIO2
+    GPIO3 = PMOD_PIN_LOWER_GPIO3
@@ -22,45 +22,8 @@ LED](https://digilent.com/reference/pmod/pmodoledrgb/start) GPIO module. This
 class is also an example of a minimal GPIO Pmod, and can be used as the base
 class for more extensive implementations.
 
-## Pin Layout
-
-The table below shows the standard GPIO pin numbers for the Pico H/W on the the
-Leeds Beckett micron-controller development board, using the standard PMod
-header below.
-
-!!! note "Check the Header Row in Use"
-    The [`LED`][lbutils.pmods.gpio.led] Pmod uses only a _single_ row of the
-    header pins at any one time. This means that _either_ Table 1 _or_ Table 2_ will
-    be in use: but **not** both at the same time.
-
-    By default the [`LED`][lbutils.pmods.gpio.led] class
-    assumes the module is connected to the _upper_ header in Table 1. This can be
-    changed to use the lower row in Table 2 in the constructor for the
-    [`LED`][lbutils.pmods.gpio.led] class: but must be specified explicitly.
-
-![PMod J1 Header Layout](https://digilent.com/reference/_media/reference/pmod/pmod-pinout-1x6.png)
-
-|        | Pin Name      | Number       | Description    |
-|--------|---------------|--------------|----------------|
-| Pin 1  | LD0           | 17           | LED 0          |
-| Pin 2  | LD1           | 19           | LED 1          |
-| Pin 3  | LD2           |              | LED 2          |
-| Pin 4  | LD3           | 18           | LED 3          |
-| Pin 5  | GND           | 3            | Ground         |
-| Pin 6  | VCC           | 5            | VCC (+3.3V)    |
-
-**Table 1: The Default Pin Layout for the `LED` PMod (Upper Header)**
-
-|        | Pin Name      | Number       | Description    |
-|--------|---------------|--------------|----------------|
-| Pin 7  | LD0           | 14           | LED 0          |
-| Pin 8  | LD1           |              | LED 1          |
-| Pin 9  | LD2           | 22           | LED 2          |
-| Pin 10 | LD3           |              | LED 3          |
-| Pin 11 | GND           | 3            | Ground         |
-| Pin 12 | VCC           | 5            | VCC (+3.3V)    |
-
-**Table 2: The Default Pin Layout for the `LED` PMod (Lower Header)**
+See the [LED Pin Layout](#led-pin-layout) in the GPIO driver reference for the
+pin numbers used on the upper and lower rows of the Pmod header.
 
 ## Examples
 
@@ -75,28 +38,179 @@ header below.
 # Import the typing hints if available. Use our backup version
 # if the official library is missing
 try:
-    from typing import List, Literal, Optional, Union
+    from typing import Iterable, Literal, Optional, Union
 except ImportError:
-    from lbutils.std.typing import List, Literal, Optional, Union  # type: ignore
+    from lbutils.std.typing import Iterable, Literal, Optional, Union  # type: ignore
 
 # Import the core libraries
+import os
 import ustruct
 import utime
 
 # Reference the MicroPython SPI and Pin library
+import machine
 from machine import SPI, Pin
 
 # Allow the use of MicroPython constants
 from micropython import const
 
 # Import the common GPIO utilities and definitions
-from .common import PMOD_ROW, PMOD_PIN_UPPER, PMOD_PIN_LOWER
+from .common import (
+    PMOD_PIN_LOWER_GPIO0,
+    PMOD_PIN_LOWER_GPIO1,
+    PMOD_PIN_LOWER_GPIO2,
+    PMOD_PIN_LOWER_GPIO3,
+    PMOD_PIN_UPPER_GPIO0,
+    PMOD_PIN_UPPER_GPIO1,
+    PMOD_PIN_UPPER_GPIO2,
+    PMOD_PIN_UPPER_GPIO3,
+    PMOD_ROW,
+    PMOD_ROW_UPPER,
+)
+
+##
+## Pin Assignments. The GPIO pin numbers of LEDs 0 to 3 for each row of the
+## Pmod header, resolved once when the module is loaded
+##
+
+_UPPER_PINS = (
+    PMOD_PIN_UPPER_GPIO0,
+    PMOD_PIN_UPPER_GPIO1,
+    PMOD_PIN_UPPER_GPIO2,
+    PMOD_PIN_UPPER_GPIO3,
+)
+_LOWER_PINS = (
+    PMOD_PIN_LOWER_GPIO0,
+    PMOD_PIN_LOWER_GPIO1,
+    PMOD_PIN_LOWER_GPIO2,
+    PMOD_PIN_LOWER_GPIO3,
+)
+
+##
+## RP2040 Single-cycle IO (SIO) Registers. Writing a mask to these registers
+## sets (or clears) all the GPIO outputs given by the bits of the mask in
+## a single operation. See the RP2040 datasheet, section 2.3.1.7. The
+## addresses are declared with `const` so the compiler folds them into the
+## code using them; and the platform test is made once, when the module is
+## loaded
+##
+## Note that the test is for the RP2040 chip, and not the `rp2` port: the
+## RP2350 shares the port, but uses these addresses for different registers.
+## On all other chips the LEDs are set using `Pin.value()`
+##
+
+_SIO_GPIO_OUT_SET = const(0xD0000014)
+_SIO_GPIO_OUT_CLR = const(0xD0000018)
+
+try:
+    _HAS_SIO = "RP2040" in os.uname().machine
+except AttributeError:
+    _HAS_SIO = False
+
+###
+### Functions
+###
+
+# Use the native code emitter for the SIO register writes if it is available:
+# otherwise fall back to the (slower) Python version
+try:
+    from ._led_native import _sio_write  # type: ignore
+except (AttributeError, ImportError, SyntaxError):
+
+    def _sio_write(set_mask: int, clr_mask: int) -> None:  # type: ignore
+        """Set the GPIO outputs given by `set_mask`, and clear the GPIO
+        outputs given by `clr_mask`, using the RP2040 SIO registers. Only
+        called when `_HAS_SIO` is `True`."""
+        mem32 = machine.mem32
+        mem32[_SIO_GPIO_OUT_SET] = set_mask
+        mem32[_SIO_GPIO_OUT_CLR] = clr_mask
+
+
+def set_states_bulk(updates: Iterable[tuple["LED", int, int]]) -> None:
+    """Set the state of the LEDs across several `LED` instances together. Each
+    entry in `updates` is a tuple of an `LED` instance and the `changed` and
+    `values` masks to apply to that instance, as described for
+    [`set_state_fast`][lbutils.pmods.gpio.led.LED.set_state_fast].
+
+    On the RP2040 the masks of all the instances are combined, and written to
+    the GPIO outputs together using a single pair of register writes. On other
+    platforms each instance is updated in turn using `set_state_fast`.
+
+    Example
+    -------
+
+    To turn on LED 0 of one `LED` Pmod, and LED 3 of a second `LED` Pmod
+
+    ````python
+    set_states_bulk([(upper_leds, 0b0001, 0b0001), (lower_leds, 0b1000, 0b1000)])
+    ````
+
+    Parameters
+    ----------
+
+    updates: Iterable[tuple[LED, int, int]]
+        The `LED` instances to update, with the `changed` and `values` masks
+        for each instance.
+    """
+    if not _HAS_SIO:
+        for led, changed, values in updates:
+            led.set_state_fast(changed, values)
+
+        return
+
+    set_mask = 0
+    clr_mask = 0
+
+    for led, changed, values in updates:
+        bits = led._bits
+
+        for index in range(4):
+            if (changed >> index) & 1:
+                if (values >> index) & 1:
+                    set_mask |= bits[index]
+                else:
+                    clr_mask |= bits[index]
+
+    _sio_write(set_mask, clr_mask)
+
 
 ###
 ### Classes
 ###
 
 
+class _LEDPin:
+    """Sets, or returns, the current state of the LED at position `index` of
+    the `LED` pins. Used as a descriptor to provide the `led0` to `led3`
+    attributes of the `LED` class from a single implementation.
+
+    When _reading_ from this attribute, a `bool` is returned with `True`
+    representing the `HIGH` (or `ON`) state of the LED, and `False`
+    representing the `LOW` (or `OFF`) state of the LED.
+
+    When _writing_ to this attribute use `True` to set the LED output `HIGH`
+    (or `ON`), or `False` to set the output `LOW` (or `OFF`).
+    """
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def __get__(
+        self, obj: Optional["LED"], objtype: Optional[type] = None
+    ) -> Union["_LEDPin", bool]:
+        # Return the descriptor itself when accessed from the class, e.g. by
+        # the documentation tools
+        if obj is None:
+            return self
+
+        return obj._setters[self.index]()
+
+    # The signature of `__set__` is fixed by the descriptor protocol, and so
+    # the `state` must be a positional argument
+    def __set__(self, obj: "LED", state: bool) -> None:  # noqa: FBT001
+        obj._setters[self.index](state)
+
+
 class LED:
     """Provides a simple GPIO interface for the `LED` Pmod, allowing the control
     of four LEDS. This class assumes the Pmod is connected to the _upper_ header
@@ -114,18 +228,58 @@ class LED:
     led0: bool
         The state of LED 0. When `True` LED 0 is on; when `False` LED 0 is off.
     led1: bool
-        The state of LED 1. When `True` LED 0 is on; when `False` LED 0 is off.
+        The state of LED 1. When `True` LED 1 is on; when `False` LED 1 is off.
     led2: bool
-        The state of LED 1. When `True` LED 0 is on; when `False` LED 0 is off.
+        The state of LED 2. When `True` LED 2 is on; when `False` LED 2 is off.
     led3: bool
-        The state of LED 1. When `True` LED 0 is on; when `False` LED 0 is off.
+        The state of LED 3. When `True` LED 3 is on; when `False` LED 3 is off.
+    pmod_row: PMOD_ROW
+        The row of the Pmod header used by the LEDs.
+    set_led0: Callable
+        Set the state of LED 0 directly, when called as `set_led0(state)`.
+        This avoids the overhead of the `led0` attribute in tight loops.
+    set_led1: Callable
+        Set the state of LED 1 directly, when called as `set_led1(state)`.
+    set_led2: Callable
+        Set the state of LED 2 directly, when called as `set_led2(state)`.
+    set_led3: Callable
+        Set the state of LED 3 directly, when called as `set_led3(state)`.
 
     Methods
     -------
 
     * `set_state()`. Set the state of the named LEDs in a single call.
+
+    * `set_state_fast()`. Set the state of selected LEDs from the bits of an
+    integer mask, leaving the other LEDs unchanged.
+
+    * `set_state_mask()`. Set the state of all the LEDs from the bits of an
+    integer mask. This is the recommended method when all the LEDs are updated
+    together at a high rate, e.g. in a tight animation loop.
     """
 
+    ##
+    ## Attribute Slots. Fixes the attributes of each instance, avoiding the
+    ## creation of a `__dict__` for every `LED`. Note that some MicroPython
+    ## ports ignore `__slots__`, in which case this is harmless
+    ##
+
+    __slots__ = (
+        "pmod_row",
+        "_gpios",
+        "_setters",
+        "_bits",
+        "_use_sio",
+        "_GPIO0",
+        "_GPIO1",
+        "_GPIO2",
+        "_GPIO3",
+        "set_led0",
+        "set_led1",
+        "set_led2",
+        "set_led3",
+    )
+
     ##
     ## Constructors
     ##
@@ -216,95 +370,62 @@ class LED:
         # Set the local attributes
         self.pmod_row = pmod_row
 
-        # Initialise the GPIO pins
-        if pmod_row == PMOD_ROW.UPPER:
-            self._GPIO0 = Pin(PMOD_PIN_UPPER.GPIO0, Pin.OUT)
-            self._GPIO1 = Pin(PMOD_PIN_UPPER.GPIO1, Pin.OUT)
-            self._GPIO2 = Pin(PMOD_PIN_UPPER.GPIO2, Pin.OUT)
-            self._GPIO3 = Pin(PMOD_PIN_UPPER.GPIO3, Pin.OUT)
-        else:
-            self._GPIO0 = Pin(PMOD_PIN_LOWER.GPIO0, Pin.OUT)
-            self._GPIO1 = Pin(PMOD_PIN_LOWER.GPIO1, Pin.OUT)
-            self._GPIO2 = Pin(PMOD_PIN_LOWER.GPIO2, Pin.OUT)
-            self._GPIO3 = Pin(PMOD_PIN_LOWER.GPIO3, Pin.OUT)
+        # Initialise the GPIO pins, selecting the pin numbers for the
+        # requested header row
+        pin_ids = _UPPER_PINS if pmod_row == PMOD_ROW_UPPER else _LOWER_PINS
 
-    ##
-    ## Public Attributes
-    ##
+        # Keep the pins in LED order for indexed access, with the
+        # individual names retained for compatibility
+        self._gpios = tuple(Pin(pin_id, Pin.OUT) for pin_id in pin_ids)
+        self._GPIO0, self._GPIO1, self._GPIO2, self._GPIO3 = self._gpios
 
-    pmod_row: PMOD_ROW
+        # Bind the `value` method of each pin once, avoiding the look-up
+        # each time the pin is read or written
+        self._setters = tuple(pin.value for pin in self._gpios)
+
+        # Expose the bound methods directly, for callers updating a single
+        # LED in a tight loop
+        self.set_led0, self.set_led1, self.set_led2, self.set_led3 = self._setters
+
+        # On the RP2040 the pins can be written together through the SIO
+        # registers, using the bit mask for each pin
+        self._bits = tuple(1 << pin_id for pin_id in pin_ids)
+        self._use_sio = _HAS_SIO
 
     ##
     ## Properties
     ##
 
-    @property
-    def led0(self) -> bool:
-        """Sets, or returns, the current state of LED 0.
-
-        When _reading_ from this property, a `bool` is returned with `True`
-        representing the `HIGH` (or `ON`) state of the LED, and `False`
-        representing the `LOW` (or `OFF`) state of the LED.
-
-        When _writing_ to this property use `True` to set the LED output `HIGH`
-        (or `ON`), or `False` to set the output `LOW` (or `OFF`).
-        """
-        return self._GPIO0.value()
-
-    @led0.setter
-    def led0(self, state: bool) -> None:
-        self._GPIO0.value(state)
-
-    @property
-    def led1(self) -> bool:
-        """Sets, or returns, the current state of LED 1.
-
-        When _reading_ from this property, a `bool` is returned with `True`
-        representing the `HIGH` (or `ON`) state of the LED, and `False`
-        representing the `LOW` (or `OFF`) state of the LED.
-
-        When _writing_ to this property use `True` to set the LED output `HIGH`
-        (or `ON`), or `False` to set the output `LOW` (or `OFF`).
-        """
-        return self._GPIO1.value()
-
-    @led1.setter
-    def led1(self, state: bool) -> None:
-        self._GPIO1.value(state)
-
-    @property
-    def led2(self) -> bool:
-        """Sets, or returns, the current state of LED 2.
-
-        When _reading_ from this property, a `bool` is returned with `True`
-        representing the `HIGH` (or `ON`) state of the LED, and `False`
-        representing the `LOW` (or `OFF`) state of the LED.
-
-        When _writing_ to this property use `True` to set the LED output `HIGH`
-        (or `ON`), or `False` to set the output `LOW` (or `OFF`).
-        """
-        return self._GPIO2.value()
-
-    @led2.setter
-    def led2(self, state: bool) -> None:
-        self._GPIO2.value(state)
-
-    @property
-    def led3(self) -> bool:
-        """Sets, or returns, the current state of LED 3.
+    led0 = _LEDPin(0)
+    led1 = _LEDPin(1)
+    led2 = _LEDPin(2)
+    led3 = _LEDPin(3)
 
-        When _reading_ from this property, a `bool` is returned with `True`
-        representing the `HIGH` (or `ON`) state of the LED, and `False`
-        representing the `LOW` (or `OFF`) state of the LED.
-
-        When _writing_ to this property use `True` to set the LED output `HIGH`
-        (or `ON`), or `False` to set the output `LOW` (or `OFF`).
-        """
-        return self._GPIO3.value()
+    ##
+    ## Private (Non-Public) Methods
+    ##
 
-    @led3.setter
-    def led3(self, state: bool) -> None:
-        self._GPIO3.value(state)
+    def _write_states(self, states: Iterable[Optional[bool]]) -> None:
+        """Set the LEDs to the given `states`, in LED order, leaving the LEDs
+        with a state of `None` unchanged. On the RP2040 all the pins are
+        written together using the SIO registers; otherwise each pin is set in
+        turn."""
+        if self._use_sio:
+            set_mask = 0
+            clr_mask = 0
+
+            for bit, state in zip(self._bits, states):
+                if state is not None:
+                    if state:
+                        set_mask |= bit
+                    else:
+                        clr_mask |= bit
+
+            _sio_write(set_mask, clr_mask)
+        else:
+            for setter, state in zip(self._setters, states):
+                if state is not None:
+                    setter(state)
 
     ##
     ## Methods
@@ -316,15 +437,19 @@ class LED:
         led1: Optional[bool] = None,
         led2: Optional[bool] = None,
         led3: Optional[bool] = None,
-        leds: Optional[List[bool]] = None,
+        leds: Optional[Iterable[Optional[bool]]] = None,
     ) -> None:
         """Set the state of the named LEDs in a single call, using `True` for
         `HIGH` (or `ON`) and `False` for `LOW` (or `OFF`). This state can be set by
         **one** of the following.
 
-        1. Using the `List` of `bool` values in the `leds` parameter to set the
-        GPIO outputs. The first value in the list will be used to set LED 0, the second
-        LED 1, etc. Missing values will _not_ result in a change of state.
+        1. Using the sequence of `bool` values in the `leds` parameter to set the
+        GPIO outputs. The first value in the sequence will be used to set LED 0, the
+        second LED 1, etc. Missing values, or values of `None`, will _not_ result in a
+        change of state; but do not prevent the later values in the sequence from being
+        used. Values beyond the fourth entry of the sequence are ignored. Any iterable
+        can be used for `leds`: a constant `tuple` (or a generator) avoids creating a
+        new `list` on each call.
         2. Using (some of) the parameters `led0` to `led3` to set the
         appropriate LED to the given state. These parameters can either be used as named
         values (e.g. `led1 = True`), or by position (e.g. `set_state(False, True)` to
@@ -341,47 +466,103 @@ class LED:
         ------
 
         ValueError:
-            If the `leds` list is specified, and the types in the list cannot be
-            converted to `bool` when setting the state of an LED.
+            If the `leds` sequence is specified, and the types in the sequence
+            cannot be converted to `bool` when setting the state of an LED.
         """
 
-        # If the `leds` array is given, attempt to use this as
-        # the source for the LED states. We will leave the exception
-        # handling to the caller if they don't obey the type specification
+        # If the `leds` array is given, attempt to use this as the source
+        # for the LED states. Otherwise set the state from the named
+        # arguments. We will leave the exception handling to the caller if
+        # they don't obey the type specification
         if leds is not None:
-            if leds[0] is not None:
-                self._GPIO0.value(leds[0])
-            else:
-                return
+            self._write_states(leds)
+        else:
+            self._write_states((led0, led1, led2, led3))
 
-            if leds[1] is not None:
-                self._GPIO1.value(leds[1])
-            else:
-                return
+    def set_state_mask(self, mask: int) -> None:
+        """Set the state of all four LEDs from the lowest four bits of `mask`,
+        with bit 0 setting the state of LED 0, bit 1 the state of LED 1, etc.
+        A bit of `1` turns the LED `ON`, and a bit of `0` turns the LED `OFF`.
 
-            if leds[2] is not None:
-                self._GPIO2.value(leds[2])
-            else:
-                return
+        Unlike [`set_state`][lbutils.pmods.gpio.led.LED.set_state], every LED is
+        set by this method. This avoids the overhead of the named (and optional)
+        parameters, and so is the recommended method for updating all the LEDs
+        together in a tight loop. For example to rotate a single lit LED
 
-            if leds[3] is not None:
-                self._GPIO3.value(leds[3])
+        ````python
+        for index in range(100):
+            led_controller.set_state_mask(1 << (index % 4))
+        ````
 
-            return
+        Parameters
+        ----------
 
-        # If we haven't been given a list of LED states, attempt to set the
-        # state from the named arguments
+        mask: int
+            The state of LEDs 0 to 3, given by bits 0 to 3 of the mask. Higher
+            bits are ignored.
+        """
+        if self._use_sio:
+            bits = self._bits
+            set_mask = 0
+            clr_mask = 0
+
+            for index in range(4):
+                if (mask >> index) & 1:
+                    set_mask |= bits[index]
+                else:
+                    clr_mask |= bits[index]
+
+            _sio_write(set_mask, clr_mask)
         else:
-            if led0 is not None:
-                self._GPIO0.value(led0)
+            setters = self._setters
+
+            setters[0](mask & 1)
+            setters[1]((mask >> 1) & 1)
+            setters[2]((mask >> 2) & 1)
+            setters[3]((mask >> 3) & 1)
+
+    def set_state_fast(self, changed: int, values: int) -> None:
+        """Set the state of the LEDs selected by the bits of `changed` to the
+        state given by the corresponding bits of `values`. Bit 0 of each mask
+        refers to LED 0, bit 1 to LED 1, etc. LEDs whose bit is clear in
+        `changed` are left in their current state.
 
-            if led1 is not None:
-                self._GPIO1.value(led1)
+        This is the integer equivalent of calling
+        [`set_state`][lbutils.pmods.gpio.led.LED.set_state] with some of the
+        LEDs set to `None`, but avoids the overhead of the optional parameters.
+        For example, to turn LED 2 `ON` and LED 3 `OFF` without changing LEDs 0
+        and 1
+
+        ````python
+        led_controller.set_state_fast(0b1100, 0b0100)
+        ````
 
-            if led2 is not None:
-                self._GPIO2.value(led2)
+        Parameters
+        ----------
 
-            if led3 is not None:
-                self._GPIO3.value(led3)
+        changed: int
+            The LEDs to change, given by bits 0 to 3 of the mask. Higher bits
+            are ignored.
+        values: int
+            The new state of the LEDs given in `changed`: a bit of `1` turns the
+            LED `ON`, and a bit of `0` turns the LED `OFF`.
+        """
+        if self._use_sio:
+            bits = self._bits
+            set_mask = 0
+            clr_mask = 0
+
+            for index in range(4):
+                if (changed >> index) & 1:
+                    if (values >> index) & 1:
+                        set_mask |= bits[index]
+                    else:
+                        clr_mask |= bits[index]
+
+            _sio_write(set_mask, clr_mask)
+        else:
+            setters = self._setters
 
-            return
+            for index in range(4):
+                if (changed >> index) & 1:
+                    setters[index]((values >> index) & 1)
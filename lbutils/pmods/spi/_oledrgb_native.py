@@ -0,0 +1,147 @@
+# This module, and all included code, is made available under the terms of the
+# MIT Licence
+#
+# Copyright (c) 2023 David Love
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Native code (Viper) implementations of the inner drawing loops used by the
+[`OLEDrgb`][lbutils.pmods.spi.oledrgb.OLEDrgb] driver. These are kept in a
+separate module as the Viper code emitter is not available on every port of
+MicroPython: and a module using the `@micropython.viper` decorator will not
+compile on those ports. The [`OLEDrgb`][lbutils.pmods.spi.oledrgb.OLEDrgb]
+driver falls back to equivalent Python versions if this module cannot be
+imported.
+
+This module is not meant to be used directly by end-user code.
+"""
+
+# Allow the use of the MicroPython code emitters
+import micropython
+
+###
+### Functions
+###
+
+
+@micropython.viper
+def colour565(red: int, green: int, blue: int) -> int:
+    """Convert the byte-valued `red`, `green` and `blue` colour components into
+    a 16-bit RGB565 word. See [`colour565`]
+    [lbutils.pmods.spi.oledrgb.colour565] for details."""
+    return ((red & 0xF8) << 8) | ((green & 0xFC) << 3) | (blue >> 3)
+
+
+@micropython.viper
+def _blit_glyph(
+    buf: ptr8,  # type: ignore  # noqa: F821
+    bits: ptr8,  # type: ignore  # noqa: F821
+    pixels: int,
+    colour: int,
+) -> None:
+    """Write the big-endian RGB565 `colour` into `buf` for each of the first
+    `pixels` set bits in the (packed, most significant bit first) glyph bitmap
+    `bits`. Pixels for clear bits in the bitmap are left unchanged.
+
+    The bitmap is scanned a byte at a time: bytes with no set bits are skipped
+    entirely, and the scan of each byte stops as soon as the remaining bits
+    are clear."""
+    hi = colour >> 8
+    lo = colour & 0xFF
+
+    for index in range((pixels + 7) >> 3):
+        byte = int(bits[index])
+        pixel = index << 3
+
+        # Ignore any bits in the final byte beyond the end of the glyph
+        if pixels - pixel < 8:
+            byte &= (0xFF << (8 - (pixels - pixel))) & 0xFF
+
+        while byte:
+            if byte & 0x80:
+                buf[2 * pixel] = hi
+                buf[2 * pixel + 1] = lo
+
+            byte = (byte << 1) & 0xFF
+            pixel += 1
+
+
+@micropython.viper
+def colour332(red: int, green: int, blue: int) -> int:
+    """Convert the byte-valued `red`, `green` and `blue` colour components into
+    an 8-bit RGB332 byte. See [`colour332`]
+    [lbutils.pmods.spi.oledrgb.colour332] for details."""
+    return (red & 0xE0) | ((green & 0xE0) >> 3) | (blue >> 6)
+
+
+@micropython.viper
+def _blit_glyph8(
+    buf: ptr8,  # type: ignore  # noqa: F821
+    bits: ptr8,  # type: ignore  # noqa: F821
+    pixels: int,
+    colour: int,
+) -> None:
+    """As for `_blit_glyph`, but writing the single byte RGB332 `colour` into
+    `buf` for each set bit of the glyph bitmap `bits`."""
+    for index in range((pixels + 7) >> 3):
+        byte = int(bits[index])
+        pixel = index << 3
+
+        # Ignore any bits in the final byte beyond the end of the glyph
+        if pixels - pixel < 8:
+            byte &= (0xFF << (8 - (pixels - pixel))) & 0xFF
+
+        while byte:
+            if byte & 0x80:
+                buf[pixel] = colour
+
+            byte = (byte << 1) & 0xFF
+            pixel += 1
+
+
+@micropython.viper
+def _rgb888_to_565(
+    src: ptr8,  # type: ignore  # noqa: F821
+    dst: ptr8,  # type: ignore  # noqa: F821
+    pixels: int,
+) -> None:
+    """Convert the first `pixels` RGB888 pixels in `src`, stored as three bytes
+    per pixel in red, green, blue order, into big-endian RGB565 pixels in
+    `dst`."""
+    for i in range(pixels):
+        red = int(src[3 * i])
+        green = int(src[3 * i + 1])
+        blue = int(src[3 * i + 2])
+
+        dst[2 * i] = (red & 0xF8) | (green >> 5)
+        dst[2 * i + 1] = ((green & 0x1C) << 3) | (blue >> 3)
+
+
+@micropython.viper
+def _rgb888_to_332(
+    src: ptr8,  # type: ignore  # noqa: F821
+    dst: ptr8,  # type: ignore  # noqa: F821
+    pixels: int,
+) -> None:
+    """Convert the first `pixels` RGB888 pixels in `src`, stored as three bytes
+    per pixel in red, green, blue order, into RGB332 pixels in `dst`."""
+    for i in range(pixels):
+        red = int(src[3 * i])
+        green = int(src[3 * i + 1])
+        blue = int(src[3 * i + 2])
+
+        dst[i] = (red & 0xE0) | ((green & 0xE0) >> 3) | (blue >> 6)
@@ -94,8 +94,9 @@ except ImportError:
     raise RuntimeError(msg) from ImportError
 
 # Import the core libraries
-import ustruct
 import utime
+from array import array
+from collections import OrderedDict
 
 # Reference the MicroPython SPI and Pin library
 from machine import SPI, Pin
@@ -143,11 +144,241 @@ _PRECHARGELEVEL = const(0xBB)
 _VCOMH = const(0xBE)
 _LOCK = const(0xFD)
 
+##
+## Colour Conversion Tables. The contribution of each (byte) colour component
+## to the packed RGB565 word, calculated once when the module is loaded. See
+## `colour565` for the details of their use.
+##
+
+_R_LUT = array("H", [(r & 0xF8) << 8 for r in range(256)])
+_G_LUT = array("H", [(g & 0xFC) << 3 for g in range(256)])
+_B_LUT = array("H", [b >> 3 for b in range(256)])
+
+##
+## Glyph Cache. The maximum number of rendered glyphs held by each `OLEDrgb`
+## instance. See `write_char` for the details of the cache.
+##
+
+_GLYPH_CACHE_SIZE = const(64)
+
+##
+## Text Block Size. The largest block of pixels, in bytes, assembled by
+## `write_text` when drawing a string. Longer (or taller) strings are drawn
+## one character at a time.
+##
+
+_TEXT_BLOCK_SIZE = const(4096)
+
+##
+## Text Cache Size. The total size, in bytes, of the blocks of pixels for the
+## strings held by each `OLEDrgb` instance. See `write_text` for the details
+## of the cache.
+##
+
+_TEXT_CACHE_SIZE = const(4096)
+
+##
+## Colour Channel Cache Size. The maximum number of colours whose drawing
+## command channels are held by each `OLEDrgb` instance. See `_channels` for
+## the details of the cache.
+##
+
+_CHANNEL_CACHE_SIZE = const(8)
+
+###
+### Functions
+###
+
+
+def colour565(red: int, green: int, blue: int) -> int:
+    """Return the RGB565 word for the colour given by the `red`, `green` and
+    `blue` bytes, in the format used for the pixel data of the SSD1331.
+
+    Unlike [`Colour.as_rgb565`][lbutils.graphics.Colour.as_rgb565], this
+    function does not require a [`Colour`][lbutils.graphics.Colour] object,
+    and is intended for the routines which build pixel data directly. The
+    conversion uses the pre-computed look-up tables for each colour component,
+    and so is reduced to three array loads and two `OR`s.
+
+    Parameters
+    ----------
+
+    red: int
+        The red component of the colour, as a byte (`0..255`).
+    green: int
+        The green component of the colour, as a byte (`0..255`).
+    blue: int
+        The blue component of the colour, as a byte (`0..255`).
+
+    Returns
+    -------
+
+    int:
+        The packed RGB565 representation of the colour.
+    """
+    return _R_LUT[red] | _G_LUT[green] | _B_LUT[blue]
+
+
+def colour332(red: int, green: int, blue: int) -> int:
+    """Return the RGB332 byte for the colour given by the `red`, `green` and
+    `blue` bytes, in the format used for the pixel data of the SSD1331 in the
+    256 colour mode. See [`colour565`][lbutils.pmods.spi.oledrgb.colour565]
+    for the equivalent conversion in the (default) 65k colour mode.
+
+    Parameters
+    ----------
+
+    red: int
+        The red component of the colour, as a byte (`0..255`).
+    green: int
+        The green component of the colour, as a byte (`0..255`).
+    blue: int
+        The blue component of the colour, as a byte (`0..255`).
+
+    Returns
+    -------
+
+    int:
+        The packed RGB332 representation of the colour.
+    """
+    return (red & 0xE0) | ((green & 0xE0) >> 3) | (blue >> 6)
+
+
+def _colour_channels(colour: graphics.Colour) -> tuple[int, int, int]:
+    """Return the red, green and blue channels of `colour` in the form used by
+    the drawing commands of the SSD1331. These commands expect each channel as
+    a 6-bit value: with the 5-bit red and blue channels of the RGB565 colour
+    shifted up by one bit to fill the range."""
+    return (
+        (colour.red >> 3) << 1,
+        colour.green >> 2,
+        (colour.blue >> 3) << 1,
+    )
+
+
+# Use the native code emitter for the colour conversion, rasterising the
+# glyphs and converting images if it is available: otherwise fall back to the
+# (slower) Python versions
+try:
+    from ._oledrgb_native import (  # type: ignore  # noqa: F811
+        _blit_glyph,
+        _blit_glyph8,
+        _rgb888_to_332,
+        _rgb888_to_565,
+        colour332,
+        colour565,
+    )
+except (AttributeError, ImportError, SyntaxError):
+
+    def _blit_glyph(  # type: ignore
+        buf: bytearray,
+        bits: Union[bytes, memoryview],
+        pixels: int,
+        colour: int,
+    ) -> None:
+        """Write the big-endian RGB565 `colour` into `buf` for each of the
+        first `pixels` set bits in the (packed, most significant bit first)
+        glyph bitmap `bits`, skipping the bytes of the bitmap with no set bits.
+        Pixels for clear bits in the bitmap are left unchanged."""
+        hi = colour >> 8
+        lo = colour & 0xFF
+
+        for index in range((pixels + 7) >> 3):
+            byte = bits[index]
+            pixel = index << 3
+
+            # Ignore any bits in the final byte beyond the end of the glyph
+            if pixels - pixel < 8:
+                byte &= (0xFF << (8 - (pixels - pixel))) & 0xFF
+
+            while byte:
+                if byte & 0x80:
+                    buf[2 * pixel] = hi
+                    buf[2 * pixel + 1] = lo
+
+                byte = (byte << 1) & 0xFF
+                pixel += 1
+
+    def _blit_glyph8(  # type: ignore
+        buf: bytearray,
+        bits: Union[bytes, memoryview],
+        pixels: int,
+        colour: int,
+    ) -> None:
+        """As for `_blit_glyph`, but writing the single byte RGB332 `colour`
+        into `buf` for each set bit of the glyph bitmap `bits`."""
+        for index in range((pixels + 7) >> 3):
+            byte = bits[index]
+            pixel = index << 3
+
+            # Ignore any bits in the final byte beyond the end of the glyph
+            if pixels - pixel < 8:
+                byte &= (0xFF << (8 - (pixels - pixel))) & 0xFF
+
+            while byte:
+                if byte & 0x80:
+                    buf[pixel] = colour
+
+                byte = (byte << 1) & 0xFF
+                pixel += 1
+
+    def _rgb888_to_565(  # type: ignore
+        src: Union[bytes, bytearray, memoryview],
+        dst: bytearray,
+        pixels: int,
+    ) -> None:
+        """Convert the first `pixels` RGB888 pixels in `src`, stored as three
+        bytes per pixel in red, green, blue order, into big-endian RGB565
+        pixels in `dst`."""
+        for i in range(pixels):
+            colour = (
+                _R_LUT[src[3 * i]] | _G_LUT[src[3 * i + 1]] | _B_LUT[src[3 * i + 2]]
+            )
+            dst[2 * i] = colour >> 8
+            dst[2 * i + 1] = colour & 0xFF
+
+    def _rgb888_to_332(  # type: ignore
+        src: Union[bytes, bytearray, memoryview],
+        dst: bytearray,
+        pixels: int,
+    ) -> None:
+        """Convert the first `pixels` RGB888 pixels in `src`, stored as three
+        bytes per pixel in red, green, blue order, into RGB332 pixels in
+        `dst`."""
+        for i in range(pixels):
+            dst[i] = colour332(src[3 * i], src[3 * i + 1], src[3 * i + 2])
+
+
 ###
 ### Classes
 ###
 
 
+class _ChipSelect:
+    """Context manager which holds the chip select of the display active (low)
+    for the duration of a `with` block. This allows a sequence of commands and
+    data to be sent to the display driver in a single SPI transaction. The
+    `with` blocks may be nested, in which case the chip select is only released
+    when the outermost block ends."""
+
+    def __init__(self, chip_sel_pin: Pin) -> None:
+        self._cs = chip_sel_pin.value
+        self._depth = 0
+
+    def __enter__(self) -> "_ChipSelect":
+        if self._depth == 0:
+            self._cs(0)
+
+        self._depth += 1
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self._depth -= 1
+
+        if self._depth == 0:
+            self._cs(1)
+
+
 class OLEDrgb(graphics.Canvas):
     """An implemention of a [`Canvas`][lbutils.graphics.Canvas] for the
     'OLEDrgb' PMod. This drawing support is provided through the following
@@ -252,6 +483,14 @@ class OLEDrgb(graphics.Canvas):
 
     * `fill_screen()`. Fill the entire `Canvas` with the background colour.
 
+    **Command Batching**
+
+    * `begin_batch()`. Collect the commands of the following drawing
+    primitives, instead of sending each command to the display as it is made.
+
+    * `end_batch()`. Send all the commands collected since `begin_batch()` to
+    the display in a single SPI transaction.
+
     **Font and Text Handling**
 
     * `write_char()`. Write a character (using the current font) starting at the
@@ -267,60 +506,53 @@ class OLEDrgb(graphics.Canvas):
     * `read_pixel()`. Return the [`Colour`][lbutils.graphics.colours.Colour] of
     the specified pixel.
 
+    * `read_pixel_raw()`. Return the packed RGB565 value of the specified pixel.
+
     * `write_pixel()`. Set the pixel at the specified position to the foreground
     colour value.
+
+    * `blit()`. Draw a block of RGB888 image data at the specified position.
     """
 
     ##
     ## Private (Non-Public) Attributes
     ##
 
-    # Command sequence used for the display initialisation
-
-    _INIT = (
-        (_LOCK, b"\x12"),  # Enable the driver IC to accept commands
-        (_DISPLAYOFF, b""),  # Send the display off command
-        (_SETREMAP, b"\x72"),  # Set the Remap to RGB Colour
-        (_STARTLINE, b"\x00"),  # Set the Display start Line to the top line
-        (_DISPLAYOFFSET, b"\x00"),  # Set the Display Offset to no vertical offset
-        (_NORMALDISPLAY, b""),  # Make it a normal display
-        (_SETMULTIPLEX, b"\x3f"),  # Set the Multiplex Ratio
-        (_SETMASTER, b"\x8e"),  # Use a required external Vcc supply
-        (_POWERMODE, b"\x0b"),  # Disable Power Saving Mode
-        (_PHASELENGTH, b"\x31"),  # Set the Phase Length of the charge and discharge
-        (
-            _CLOCKDIV,
-            b"\xf0",
-        ),  # Set the Display Clock Divide Ratio and Oscillator Frequency
-        (_PRECHARGEA, b"\x64"),  # Set the Second Pre-Charge Speed of Color A (Red)
-        (_PRECHARGEB, b"\x78"),  # Set the Second Pre-Charge Speed of Color B (Green)
-        (_PRECHARGEC, b"\x64"),  # Set the Second Pre-Charge Speed of Color C (Blue)
-        (
-            _PRECHARGELEVEL,
-            b"\x3a",
-        ),  # Set the Pre-Charge Voltage to approximately 45% of Vcc
-        (_VCOMH, b"\x3e"),  # Set the VCOMH Deselect Level
-        (_MASTERCURRENT, b"\x0c"),  # Set Master Current Attenuation Factor
-        (_CONTRASTA, b"\x91"),  # Set the Contrast for Color A (Red)
-        (_CONTRASTB, b"\x50"),  # Set the Contrast for Color B (Green)
-        (_CONTRASTC, b"\x7d"),  # Set the Contrast for Color C (Blue)
-        (_NO_SCROLL, b""),  # Disable Scrolling
+    # Command sequence used for the display initialisation. Each command is
+    # followed directly by its parameters: as the SSD1331 accepts the command
+    # parameters whilst in command mode, the whole sequence is held as a single
+    # byte string and sent in one SPI write
+
+    _INIT_BLOB = (
+        b"\xfd\x12"  # Enable the driver IC to accept commands
+        b"\xae"  # Send the display off command
+        b"\xa0\x72"  # Set the Remap to RGB Colour
+        b"\xa1\x00"  # Set the Display start Line to the top line
+        b"\xa2\x00"  # Set the Display Offset to no vertical offset
+        b"\xa4"  # Make it a normal display
+        b"\xa8\x3f"  # Set the Multiplex Ratio
+        b"\xad\x8e"  # Use a required external Vcc supply
+        b"\xb0\x0b"  # Disable Power Saving Mode
+        b"\xb1\x31"  # Set the Phase Length of the charge and discharge
+        b"\xb3\xf0"  # Set the Display Clock Divide Ratio and Oscillator Frequency
+        b"\x8a\x64"  # Set the Second Pre-Charge Speed of Color A (Red)
+        b"\x8b\x78"  # Set the Second Pre-Charge Speed of Color B (Green)
+        b"\x8c\x64"  # Set the Second Pre-Charge Speed of Color C (Blue)
+        b"\xbb\x3a"  # Set the Pre-Charge Voltage to approximately 45% of Vcc
+        b"\xbe\x3e"  # Set the VCOMH Deselect Level
+        b"\x87\x0c"  # Set Master Current Attenuation Factor
+        b"\x81\x91"  # Set the Contrast for Color A (Red)
+        b"\x82\x50"  # Set the Contrast for Color B (Green)
+        b"\x83\x7d"  # Set the Contrast for Color C (Blue)
+        b"\x2e"  # Disable Scrolling
     )
 
-    #
-    # Format strings used in byte packing structures
-    #
-
-    _ENCODE_PIXEL = ">H"
-    _ENCODE_POS = ">BB"
-    _ENCODE_LINE = ">BBBBBBB"
-    _ENCODE_RECT = ">BBBBBBBBBB"
-
     ##
     ## Public Attributes
     ##
 
     spi_controller: SPI
+    colour_depth: int
     data_cmd_pin = Pin
     chip_sel_pin = Pin
     reset_pin = Pin
@@ -332,20 +564,21 @@ class OLEDrgb(graphics.Canvas):
 
     def __init__(
         self,
-        spi_controller: SPI = SPI(0, 100000, mosi=Pin(19), sck=Pin(18)),
+        spi_controller: SPI = SPI(0, 6600000, mosi=Pin(19), sck=Pin(18)),
         data_cmd_pin: Pin = Pin(14, Pin.OUT),
         chip_sel_pin: Pin = Pin(17, Pin.OUT),
         reset_pin: Pin = Pin(15, Pin.OUT),
         vcc_enable: Pin = Pin(22, Pin.OUT),
         width: int = 96,
         height: int = 64,
+        colour_depth: int = 16,
     ) -> None:
         """Initialise the SPI interface, and sent the sequence of commands
         required for the device startup. The full command sequence is documented
         [here](https://digilent.com/reference/pmod/pmodoledrgb/reference-
-        manual), and is recorded in the (private) `_INIT` array.
+        manual), and is recorded in the (private) `_INIT_BLOB` string.
 
-        Client are not expected to modify the contents of the `INIT` array,
+        Client are not expected to modify the contents of the `_INIT_BLOB`,
         but instead provide the details of specific devices in the `width`
         and `height` parameters. Both the `width` and the `height` are set
         to the defaults of the OLEDrgb Pmod: but this driver may be useful
@@ -373,9 +606,14 @@ class OLEDrgb(graphics.Canvas):
 
         ````python
         # Instantiate the SPI interface
-        spi_controller = SPI(0, 100000, mosi=Pin(19), sck=Pin(18))
+        spi_controller = SPI(0, 6600000, mosi=Pin(19), sck=Pin(18))
         ````
 
+        The SSD1331 accepts a serial clock period down to 150 ns, and so the
+        SPI interface can be run at up to 6.6 MHz. Slower clock rates will
+        also work, but all drawing on the display will be slowed in
+        proportion.
+
         The display driver also requires three control pins outside the
         SPI interface: the `data_cmd_pin`, `chip_sel_pin` and `reset_pin`.
         Select appropriate GPIO pins for the interface, and create
@@ -424,7 +662,9 @@ class OLEDrgb(graphics.Canvas):
             An instance of the
             [`machine.SPI`](https://docs.micropython.org/en/latest/library/machine.SPI.html)
             class, used to specify the SPI interface that should be used by this
-            driver to interface to the display controller.
+            driver to interface to the display controller. Defaults to SPI
+            controller 0 with a 6.6 MHz clock: the fastest supported by the
+            SSD1331.
         data_cmd_pin: int, optional
             The '`D/C`' or 'Data/Command' pin; used to send low-level
             instructions to the display driver. Defaults to GPIO Pin 14.
@@ -441,8 +681,25 @@ class OLEDrgb(graphics.Canvas):
             The width in pixels of the display. Defaults to 96.
         height: int, optional
             The height in pixels of the display. Defaults to 64.
+        colour_depth: int, optional
+            The number of bits used for each pixel sent to the display: either
+            `16` for the 65k colour (RGB565) mode, or `8` for the 256 colour
+            (RGB332) mode. The 256 colour mode halves the data sent for text
+            and other blocks of pixels, at the cost of colour resolution.
+            Defaults to 16.
+
+        Raises
+        ------
+
+        ValueError:
+            If the `colour_depth` is not one of `8` or `16`.
         """
 
+        # Check the colour depth is supported by the display driver
+        if colour_depth not in (8, 16):
+            msg = "The 'colour_depth' must be either 8 or 16 bits per pixel"
+            raise ValueError(msg)
+
         # Set the ancestor values
         super().__init__(width, height)
 
@@ -452,6 +709,80 @@ class OLEDrgb(graphics.Canvas):
         self.chip_sel_pin = chip_sel_pin
         self.reset_pin = reset_pin
         self.vcc_enable = vcc_enable
+        self.colour_depth = colour_depth
+
+        # Set the size, in bytes, of each pixel sent to the display, and the
+        # function used to pack the colours into the pixels
+        self._pixel_size = colour_depth // 8
+        self._pack_colour = colour565 if colour_depth == 16 else colour332
+
+        # Bind the pin and SPI methods used for every transfer, saving the
+        # attribute look-ups on each call to `_write_cmd`
+        self._dc = data_cmd_pin.value
+        self._cs = chip_sel_pin.value
+        self._spi_write = spi_controller.write
+
+        # The last level written to the `data_cmd_pin` by the transfer
+        # methods, so that the pin is only changed when needed. The initial
+        # value of `-1` forces the first transfer to set the pin
+        self._dc_state = -1
+
+        # Pre-allocate the buffers used to pack the drawing commands, so
+        # the drawing primitives do not create new objects on each call
+        self._line_buf = bytearray(7)
+
+        # Rectangles are drawn using a single stream of commands: setting the
+        # fill mode, followed by the rectangle itself. See `_draw_rect`
+        self._rect_buf = bytearray((_FILL, 0, _DRAWRECT, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+
+        # Scratch buffers for the command byte and the pixel data. As the SPI
+        # transfers are blocking, these can be re-used as soon as `_write_cmd`
+        # returns
+        self._cmd_buf = bytearray(1)
+        self._pix_buf = bytearray(self._pixel_size)
+        self._read_buf = bytearray(2)
+
+        # The column and row commands used to select a window of the display,
+        # with the parameters filled in by `_set_window`
+        self._win_buf = bytearray((_SETCOLUMN, 0, 0, _SETROW, 0, 0))
+
+        # Context manager used to hold the chip select across a sequence of
+        # commands, see `_emit_data`
+        self._cs_held = _ChipSelect(chip_sel_pin)
+
+        # Commands collected between calls to `begin_batch` and `end_batch`,
+        # or `None` if the commands are sent as they are made
+        self._batch: Optional[bytearray] = None
+
+        # Cache the packed full-screen rectangle used by `fill_screen`, keyed
+        # by the channels of the last fill colour written to the command
+        self._fill_key: Optional[tuple[int, int, int]] = None
+        self._fill_buf = bytearray(
+            (_FILL, 1, _DRAWRECT, 0, 0, width - 1, height - 1, 0, 0, 0, 0, 0, 0)
+        )
+
+        # The last fill mode sent to the display driver, or `None` if the
+        # mode is not known. See `_draw_rect`
+        self._fill_enabled: Optional[int] = None
+
+        # Clearing the display to black is common enough to keep its own
+        # rectangle command, which is never invalidated by other fill colours
+        self._black_fill_buf = bytes(
+            (_FILL, 1, _DRAWRECT, 0, 0, width - 1, height - 1, 0, 0, 0, 0, 0, 0)
+        )
+
+        # Least-recently used cache of the rendered glyphs used
+        # by `write_char`
+        self._glyph_cache: OrderedDict = OrderedDict()
+
+        # Cache of the drawing command channels of the recently used colours,
+        # see `_channels`
+        self._channel_cache: dict = {}
+
+        # Least-recently used cache of the pixel blocks drawn by `write_text`,
+        # and the total size of the blocks in the cache
+        self._text_cache: OrderedDict = OrderedDict()
+        self._text_cache_used = 0
 
         # Initialise the display: see the OLED reference
         # for details of this step
@@ -465,12 +796,11 @@ class OLEDrgb(graphics.Canvas):
         self.reset_pin.value(1)
         utime.sleep_ms(5)
 
-        for command, data in self._INIT:
-            self._write(command, data)
+        self._write_init()
 
         self.vcc_enable.value(1)
         utime.sleep_ms(25)
-        self._write(_DISPLAYON, b"")
+        self._write_cmd(_DISPLAYON)
         utime.sleep_ms(100)
 
     ##
@@ -482,39 +812,209 @@ class OLEDrgb(graphics.Canvas):
         command: Optional[int] = None,
         count: Optional[int] = 0,
     ) -> int:
-        """Decode a command read on the `data_cmd_pin` from the display
-        driver."""
-        self.data_cmd_pin.value(0)
-        self.chip_sel_pin.value(0)
+        """Send the (optional) `command` to the display driver, and then read
+        `count` bytes in reply. The bytes read are returned as a single
+        big-endian integer, or `0` if no bytes are read."""
+        value = 0
+
+        if self._batch is not None:
+            self._flush_batch()
+
+        if self._dc_state != 0:
+            self._dc(0)
+            self._dc_state = 0
+
+        self._cs(0)
 
         if command is not None:
-            self.spi_controller.write(bytearray([command]))
+            self._cmd_buf[0] = command
+            self._spi_write(self._cmd_buf)
         if count:
-            data = self.spi_controller.read(count)
+            # Re-use the pixel-sized read buffer where possible
+            read_buf = self._read_buf
+
+            if count != len(read_buf):
+                read_buf = bytearray(count)
+
+            self.spi_controller.readinto(read_buf)
 
-        self.chip_sel_pin.value(1)
+            for byte in read_buf:
+                value = (value << 8) | byte
 
-        return data
+        self._cs(1)
 
-    def _write(
+        return value
+
+    def _write_cmd(
         self,
-        command: Optional[int] = None,
-        data: Optional[Union[bytes, bytearray]] = None,
+        command: int,
+        data: Union[bytes, bytearray, memoryview] = b"",
     ) -> None:
-        """Write a command over the `data_cmd_pin` to the display driver."""
-        if command is None:
-            self.data_cmd_pin.value(1)
-        else:
-            self.data_cmd_pin.value(0)
+        """Write the `command`, followed by its parameters in `data` (if any),
+        to the display driver in a single SPI transaction."""
+        batch = self._batch
 
-        self.chip_sel_pin.value(0)
+        if batch is not None:
+            batch.append(command)
+            batch.extend(data)
+            return
 
-        if command is not None:
-            self.spi_controller.write(bytearray([command]))
-        if data is not None:
-            self.spi_controller.write(data)
+        if self._dc_state != 0:
+            self._dc(0)
+            self._dc_state = 0
+
+        self._cs(0)
+
+        self._cmd_buf[0] = command
+        self._spi_write(self._cmd_buf)
+
+        if data:
+            self._spi_write(data)
+
+        self._cs(1)
+
+    def _emit_data(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Write the (pixel) `data` to the display driver _without_ changing
+        the chip select. Must be called inside a `with self._cs_held` block,
+        allowing the data to share a single SPI transaction with the commands
+        sent by `_emit_commands`."""
+        if self._batch is not None:
+            self._flush_batch()
+
+        if self._dc_state != 1:
+            self._dc(1)
+            self._dc_state = 1
+
+        self._spi_write(data)
 
-        self.chip_sel_pin.value(1)
+    def _write_commands(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Write a pre-formatted stream of commands, and their parameters, to
+        the display driver in a single SPI transaction."""
+        batch = self._batch
+
+        if batch is not None:
+            batch.extend(data)
+            return
+
+        with self._cs_held:
+            self._emit_commands(data)
+
+    def _emit_commands(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Write a pre-formatted stream of commands, and their parameters, to
+        the display driver _without_ changing the chip select. Must be called
+        inside a `with self._cs_held` block: see `_emit_data`."""
+        batch = self._batch
+
+        if batch is not None:
+            batch.extend(data)
+            return
+
+        if self._dc_state != 0:
+            self._dc(0)
+            self._dc_state = 0
+
+        self._spi_write(data)
+
+    def _flush_batch(self) -> None:
+        """Send the commands collected by the current batch to the display
+        driver, leaving the batch open but empty. Called before any data is
+        sent or read, so that the commands and data reach the display driver
+        in the order they were made."""
+        batch = self._batch
+
+        if batch:
+            self._batch = None
+            self._write_commands(batch)
+            self._batch = bytearray()
+
+    def _channels(self, colour: graphics.Colour) -> tuple[int, int, int]:
+        """Return the red, green and blue channels of `colour` in the form used
+        by the drawing commands: see `_colour_channels`. As the `Colour`
+        objects are not changed once created, the channels are cached for the
+        last few colours used. The cache is keyed on the `Colour` object
+        itself, and is cleared once it is full."""
+        channels = self._channel_cache.get(colour)
+
+        if channels is None:
+            if len(self._channel_cache) >= _CHANNEL_CACHE_SIZE:
+                self._channel_cache.clear()
+
+            channels = _colour_channels(colour)
+            self._channel_cache[colour] = channels
+
+        return channels
+
+    def _cached_glyph(
+        self,
+        utf8_char: str,
+        pixels: int,
+        fg_colour: int,
+        bg_colour: int,
+    ) -> bytearray:
+        """Return the glyph of `utf8_char` in the current `font`, rendered as
+        `pixels` pixels in the `fg_colour` and `bg_colour`.
+        Glyphs are held in a least-recently used cache: re-inserting the glyph
+        moves it to the end of the cache, marking it as the most recently
+        used."""
+        glyph_key = (utf8_char, self.font, fg_colour, bg_colour)
+        glyph = self._glyph_cache.pop(glyph_key, None)
+
+        if glyph is None:
+            self.font.set_position(utf8_char)
+            glyph = self._render_glyph(pixels, fg_colour, bg_colour)
+
+            if len(self._glyph_cache) >= _GLYPH_CACHE_SIZE:
+                del self._glyph_cache[next(iter(self._glyph_cache))]
+
+        self._glyph_cache[glyph_key] = glyph
+
+        return glyph
+
+    def _render_glyph(
+        self,
+        pixels: int,
+        fg_colour: int,
+        bg_colour: int,
+    ) -> bytearray:
+        """Render the first `pixels` bits of the current glyph in the `font` as
+        a sequence of pixels in the format set by the `colour_depth`, using
+        `fg_colour` for the set bits and `bg_colour` for the clear bits.
+        Assumes that `set_position` has already been called on the `font`."""
+        glyph = bytearray(bg_colour.to_bytes(self._pixel_size, "big") * pixels)
+
+        if self._pixel_size == 2:
+            _blit_glyph(glyph, self.font.get_raw(), pixels, fg_colour)
+        else:
+            _blit_glyph8(glyph, self.font.get_raw(), pixels, fg_colour)
+
+        return glyph
+
+    def _write_init(self) -> None:
+        """Send the display initialisation sequence, held in `_INIT_BLOB`, to
+        the display driver in a single SPI transaction. If the 256 colour mode
+        has been selected, the colour depth set by the sequence is then
+        changed to 8 bits per pixel."""
+        self._write_commands(self._INIT_BLOB)
+
+        if self.colour_depth == 8:
+            self._write_cmd(_SETREMAP, b"\x32")
+
+        # The fill mode of the display driver is now unknown
+        self._fill_enabled = None
+
+    def _draw_rect(self, rect_cmd: Union[bytes, bytearray]) -> None:
+        """Send the rectangle command stream `rect_cmd` to the display driver
+        in a single SPI transaction. The stream holds the `_FILL` command and
+        fill mode in the first two bytes, followed by the `_DRAWRECT` command
+        and its parameters. The `_FILL` command is only sent if the fill mode
+        is different from the mode set by the last rectangle."""
+        fill = rect_cmd[1]
+
+        if fill != self._fill_enabled:
+            self._write_commands(rect_cmd)
+            self._fill_enabled = fill
+        else:
+            self._write_commands(memoryview(rect_cmd)[2:])
 
     def _block(
         self,
@@ -522,11 +1022,33 @@ class OLEDrgb(graphics.Canvas):
         y: int,
         width: int,
         height: int,
-        data: Union[bytes, bytearray],
+        data: Union[bytes, bytearray, memoryview],
     ) -> None:
-        self._write(_SETCOLUMN, bytearray([x, x + width - 1]))
-        self._write(_SETROW, bytearray([y, y + height - 1]))
-        self._write(None, data)
+        """Write the pixels in `data` to the window of the display starting at
+        (`x`, `y`) of the given `width` and `height`, in a single SPI
+        transaction.
+
+        The transfer is synchronous: `machine.SPI.write` on the RP2040 does not
+        return until all of `data` has been sent. Callers may therefore re-use
+        (or modify) `data` as soon as this method returns, without the need for
+        double-buffering."""
+        self._set_window(x, y, x + width - 1, y + height - 1)
+
+        with self._cs_held:
+            self._emit_commands(self._win_buf)
+            self._emit_data(data)
+
+    def _set_window(self, x0: int, y0: int, x1: int, y1: int) -> None:
+        """Fill the parameters of the column and row commands in `_win_buf`,
+        selecting the window of the display from (`x0`, `y0`) to (`x1`, `y1`)
+        inclusive. Both commands can then be sent in a single write using
+        `_emit_commands`."""
+        win_buf = self._win_buf
+
+        win_buf[1] = x0
+        win_buf[2] = x1
+        win_buf[4] = y0
+        win_buf[5] = y1
 
     ##
     ## Methods
@@ -551,10 +1073,33 @@ class OLEDrgb(graphics.Canvas):
              The [`Colour`][lbutils.graphics.Colour] representation of the pixel
              located at (x, y).
         """
-        self._write(_SETCOLUMN, bytearray([x, x]))
-        self._write(_SETROW, bytearray([y, y]))
+        return graphics.Colour.from_565(self.read_pixel_raw(x, y))
+
+    def read_pixel_raw(self, x: int, y: int) -> int:
+        """Read the value of the pixel at position (`x`, `y`) as the packed
+        RGB565 word returned by the display driver. Unlike [`read_pixel`]
+        [lbutils.pmods.spi.oledrgb.OLEDrgb.read_pixel], no
+        [`Colour`][lbutils.graphics.Colour] object is created, making this
+        method suitable for routines which read (and compare) many pixels.
+
+        Parameters
+        ----------
+
+        x: int
+            The x co-ordinate of the pixel to read
+        y: int
+            The y co-ordinate of the pixel to read
+
+        Returns
+        -------
+
+        int:
+             The RGB565 value of the pixel located at (x, y).
+        """
+        self._set_window(x, y, x, y)
+        self._write_commands(self._win_buf)
 
-        return graphics.Colour.from_565(self._read(None, 2))
+        return self._read(None, 2)
 
     def write_pixel(self, x: int, y: int, colour: graphics.Colour) -> None:
         """Set the pixel at position (`x`, `y`) to the specified colour value.
@@ -570,11 +1115,106 @@ class OLEDrgb(graphics.Canvas):
              The [`Colour`][lbutils.graphics.Colour] representation of the pixel
              located at (x, y).
         """
-        self._write(_SETCOLUMN, bytearray([x, x]))
-        self._write(_SETROW, bytearray([y, y]))
+        pix_buf = self._pix_buf
+        pixel = self._pack_colour(colour.red, colour.green, colour.blue)
+
+        # Select a window of the single pixel, with both the column and the
+        # row commands sent in one write
+        self._set_window(x, y, x, y)
+
+        # Then write the (big-endian) value of the pixel directly into the
+        # window selected above
+        if self._pixel_size == 2:
+            pix_buf[0] = pixel >> 8
+            pix_buf[1] = pixel & 0xFF
+        else:
+            pix_buf[0] = pixel
+
+        with self._cs_held:
+            self._emit_commands(self._win_buf)
+            self._emit_data(pix_buf)
+
+    def blit(
+        self,
+        image_data: Union[bytes, bytearray, memoryview],
+        width: int,
+        height: int,
+        start: Optional[tuple[int, int]] = None,
+    ) -> None:
+        """Draw the `width` x `height` image held in `image_data` at the
+        `start` co-ordinate, or the current cursor position if `start` is
+        `None`. The image is converted to the pixel format of the display, and
+        then sent to the display in a single transfer.
+
+        Example
+        -------
+
+        The `image_data` is expected as packed RGB888 pixels, row by row, in the
+        same layout as returned by `tobytes()` for an RGB image from the Python
+        Imaging Library. For example, an image prepared on a host computer with
+
+        ````python
+        data = Image.open("logo.png").convert("RGB").resize((32, 32)).tobytes()
+        ````
+
+        can be saved to a file, loaded onto the board, and then drawn at the
+        top left of the display with
+
+        ````python
+        oled_display.blit(data, 32, 32, start = (0, 0))
+        ````
+
+        Parameters
+        ----------
+
+        image_data: bytes
+             The pixels of the image, as three bytes (red, green, blue) for
+             each pixel.
+        width: int
+             The width of the image in pixels.
+        height: int
+             The height of the image in pixels.
+        start: tuple, optional
+             The (x, y) co-ordinate of the top-left corner of the image, with
+             the first value of the `tuple` representing the `x` co-ordinate and
+             the second value of the `tuple` representing the `y` co-ordinate. If
+             the `start` is `None`, the default, then the current value of the
+             [`cursor`][lbutils.graphics.Canvas.cursor] is used. Values beyond
+             the first and second entries of the `tuple` are ignored.
+
+        Raises
+        ------
 
-        #          self._write(None,bytearray([colour >> 8, colour &0xff]))
-        self.draw_line(start=(x, y), end=(x, y), fg_colour=colour)
+        ValueError:
+            If the image does not fit entirely on the display, or if
+            `image_data` holds fewer than `width` x `height` pixels.
+        """
+        if start is None:
+            x, y = self.cursor.x_y
+        else:
+            x = start[0]
+            y = start[1]
+
+        pixels = width * height
+
+        if x < 0 or y < 0 or x + width > self.width or y + height > self.height:
+            msg = "The image passed to 'blit' does not fit on the display"
+            raise ValueError(msg)
+
+        if len(image_data) < pixels * 3:
+            msg = "The 'image_data' passed to 'blit' is smaller than the image"
+            raise ValueError(msg)
+
+        # Convert the image to the pixel format of the display, and then send
+        # the whole image as a single block
+        block = bytearray(pixels * self._pixel_size)
+
+        if self._pixel_size == 2:
+            _rgb888_to_565(image_data, block, pixels)
+        else:
+            _rgb888_to_332(image_data, block, pixels)
+
+        self._block(x, y, width, height, block)
 
     def draw_line(
         self,
@@ -663,39 +1303,33 @@ class OLEDrgb(graphics.Canvas):
         """
 
         use_fg_colour = self.select_fg_colour(fg_colour=fg_colour, pen=pen)
+        fg_red, fg_green, fg_blue = self._channels(use_fg_colour)
+
+        if start is None:
+            start = self.cursor.x_y
+
+        # Fill the parameters of the drawing command directly, as each
+        # parameter is a single byte
+        line_buf = self._line_buf
 
         try:
-            if start is None:
-                data = ustruct.pack(
-                    self._ENCODE_LINE,
-                    self.cursor.x,
-                    self.cursor.y,
-                    end[0],
-                    end[1],
-                    use_fg_colour.red,
-                    use_fg_colour.green,
-                    use_fg_colour.blue,
-                )
-            else:
-                data = ustruct.pack(
-                    self._ENCODE_LINE,
-                    start[0],
-                    start[1],
-                    end[0],
-                    end[1],
-                    use_fg_colour.red,
-                    use_fg_colour.green,
-                    use_fg_colour.blue,
-                )
-        except ustruct.error:
+            line_buf[0] = start[0]
+            line_buf[1] = start[1]
+            line_buf[2] = end[0]
+            line_buf[3] = end[1]
+        except (TypeError, ValueError):
             msg = (
                 "Invalid parameters has been passed to 'draw_line'. I cannot"
                 "interpret the co-ordinates passed as arguments: check the"
                 "'start' and 'end' tuples are correct",
             )
-            raise ValueError(msg) from ustruct.error
+            raise ValueError(msg) from ValueError
 
-        self._write(_DRAWLINE, data)
+        line_buf[4] = fg_red
+        line_buf[5] = fg_green
+        line_buf[6] = fg_blue
+
+        self._write_cmd(_DRAWLINE, self._line_buf)
 
     def draw_rectangle(
         self,
@@ -711,16 +1345,18 @@ class OLEDrgb(graphics.Canvas):
         postion if `start` is `None`. In either case the rectangle will be drawn
         to the specified `height` and `width`, using the either the specified or
         `Canvas` `fg_colour` for the frame of the rectangle. If the `style` is
-        `"FILLED"` then  either the specified `bg_colour` or `Canvas` `bg_color`
-        as the interior colour. If the `style` is `"FRAMED"` then the interior
-        of the rectangle is not drawn.
+        `RECTANGLE_STYLE.FILLED` then  either the specified `bg_colour` or
+        `Canvas` `bg_color` as the interior colour. If the `style` is
+        `RECTANGLE_STYLE.FRAMED` then the interior of the rectangle is not
+        drawn.
 
         See either [`select_fg_colour`]
         [lbutils.graphics.Canvas.select_fg_colour] for more details of the
         foreground colour selection algorithm; or [`select_bg_colour`]
         [lbutils.graphics.Canvas.select_bg_colour] for more details of the
         background colour selection algorithm. By default the rectangle is
-        `"FILLED"` and so both the background and foreground colours are used.
+        `RECTANGLE_STYLE.FILLED` and so both the background and foreground
+        colours are used.
 
         Parameters
         ----------
@@ -759,51 +1395,429 @@ class OLEDrgb(graphics.Canvas):
 
         use_fg_colour = self.select_fg_colour(fg_colour=fg_colour, pen=pen)
         use_bg_colour = self.select_bg_colour(bg_colour=bg_colour, pen=pen)
-
-        # Send the commands to fill, or not fill, the rectangle
-        if style == "FILLED":
-            self._write(_FILL, b"\x01")
-        else:
-            self._write(_FILL, b"\x00")
-
+        fg_red, fg_green, fg_blue = self._channels(use_fg_colour)
+        bg_red, bg_green, bg_blue = self._channels(use_bg_colour)
+
+        # Set the display driver to fill, or not fill, the rectangle. The
+        # values of the `RECTANGLE_STYLE` are also the fill modes used by the
+        # display driver, and so can be sent without further tests
+        rect_buf = self._rect_buf
+        rect_buf[1] = style
+
+        # Set the parameters of the drawing command (the colour data is
+        # ignored if the rectangle is not filled). Each parameter is a single
+        # byte, and so can be set directly
         if start is None:
-            # Send the drawing command (the colour data is ignored if the
-            # rectangle is not filled)
-            data = ustruct.pack(
-                self._ENCODE_RECT,
-                self.cursor.x,
-                self.cursor.y,
-                self.cursor.x + width - 1,
-                self.cursor.y + height - 1,
-                use_fg_colour.red,
-                use_fg_colour.green,
-                use_fg_colour.blue,
-                use_bg_colour.red,
-                use_bg_colour.green,
-                use_bg_colour.blue,
-            )
+            cursor = self.cursor
+            x0 = cursor.x
+            y0 = cursor.y
         else:
-            # Send the drawing command (the colour data is ignored if the
-            # rectangle is not filled)
-            data = ustruct.pack(
-                self._ENCODE_RECT,
-                start[0],
-                start[1],
-                start[0] + width - 1,
-                start[1] + height - 1,
-                use_fg_colour.red,
-                use_fg_colour.green,
-                use_fg_colour.blue,
-                use_bg_colour.red,
-                use_bg_colour.green,
-                use_bg_colour.blue,
+            x0 = start[0]
+            y0 = start[1]
+
+        rect_buf[3] = x0
+        rect_buf[4] = y0
+        rect_buf[5] = x0 + width - 1
+        rect_buf[6] = y0 + height - 1
+
+        rect_buf[7] = fg_red
+        rect_buf[8] = fg_green
+        rect_buf[9] = fg_blue
+        rect_buf[10] = bg_red
+        rect_buf[11] = bg_green
+        rect_buf[12] = bg_blue
+
+        self._draw_rect(rect_buf)
+
+    def write_text(
+        self,
+        txt_str: str,
+        start: Optional[tuple[int, int]] = None,
+        fg_colour: Optional[graphics.Colour] = None,
+        pen: Optional[graphics.Pen] = None,
+    ) -> None:
+        """Write the string `txt_str` (using the current `font`) starting at the
+        the pixel position (`x`, `y`) specified either by the `cursor` (the
+        default) or the `start` tuple. The text string is then written in the
+        specified `fg_colour`, or selected from the `Canvas` `fg_colour`, to the
+        display. See
+        [`select_fg_colour`][lbutils.graphics.Canvas.select_fg_colour] for more
+        details of the colour selection algorithm.
+
+        Unlike the generic [`write_text`][lbutils.graphics.Canvas.write_text]
+        of the `Canvas`, the glyphs of the string are assembled into a single
+        block of pixels, which is then sent to the display in one transfer. The
+        whole of the block, including the space between the glyphs, is drawn in
+        the background colour: see [`select_bg_colour`]
+        [lbutils.graphics.Canvas.select_bg_colour]. If the block would be
+        larger than 4 KB, the string is instead written one character at a time
+        using [`write_char`][lbutils.pmods.spi.oledrgb.OLEDrgb.write_char],
+        with the chip select of the display held for the whole string.
+
+        The blocks for the most recently drawn strings, up to a total of 4 KB,
+        are also kept in a least-recently used cache: keyed on the string,
+        font, colours and position. Redrawing the same text in the same place
+        (e.g. labels or status lines) therefore only sends the cached block to
+        the display.
+
+        Parameters
+        ----------
+
+        txt_str: str
+             The string of characters to write to the display.
+        start: tuple, optional
+             The (x, y) co-ordinate of the _start_ point of the string, with
+             the first value of the `tuple` representing the `x` co-ordinate and
+             the second value of the `tuple` representing the `y` co-ordinate. If
+             the `start` is `None`, the default, then the current value of the
+             [`cursor`][lbutils.graphics.Canvas.cursor] is used as the start
+             point of the string. Values beyond the first and second entries
+             of the `tuple` are ignored.
+        fg_colour: Type[graphics.Colour], optional
+             The [`Colour`][lbutils.graphics.Colour] to be used when drawing the
+             string. If not specified, use the preference order for the
+             foreground colour of the `Canvas` to find a suitable colour.
+        pen: Type[graphics.Pen], optional
+             The [`Pen`][lbutils.graphics.Pen] to be used when drawing the
+             string. If not specified, use the preference order for the
+             foreground and background colours of the `Canvas` to find suitable
+             colours.
+        """
+
+        # Check to see if we have a valid font: if not things
+        # end here
+        font = self.font
+
+        if font is None:
+            return
+
+        # If the `start` has been given, move the cursor
+        # to that co-ordinate
+        if start is not None:
+            self.cursor.x_y = start
+
+        x = self.cursor.x
+        y = self.cursor.y
+
+        # Work out the colours to use for the glyphs
+        use_fg_colour = self.select_fg_colour(fg_colour=fg_colour, pen=pen)
+        use_bg_colour = self.select_bg_colour(pen=pen)
+
+        pack_colour = self._pack_colour
+        pixel_size = self._pixel_size
+
+        fg_pixel = pack_colour(
+            use_fg_colour.red, use_fg_colour.green, use_fg_colour.blue
+        )
+        bg_pixel = pack_colour(
+            use_bg_colour.red, use_bg_colour.green, use_bg_colour.blue
+        )
+
+        # If the same string has been drawn at this position before, send the
+        # cached block of pixels straight to the display
+        text_key = (txt_str, font, fg_pixel, bg_pixel, x, y)
+        cached = self._text_cache.pop(text_key, None)
+
+        if cached is not None:
+            self._text_cache[text_key] = cached
+
+            left, top, block_width, block_height, block, end_x = cached
+            self._block(left, top, block_width, block_height, block)
+            self.cursor.x = end_x
+            return
+
+        # Find the position of each (visible) glyph in the string, and the
+        # bounding box of the whole string
+        glyphs = []
+        left = self.width
+        top = self.height
+        right = 0
+        bottom = 0
+
+        for character in txt_str:
+            font.set_position(character)
+            _offset, _width, _height, _cursor, x_off, y_off = font.current_glyph
+
+            if _width != 0 and _height != 0:
+                glyphs.append((character, x + x_off, y + y_off, _width, _height))
+
+                left = min(left, x + x_off)
+                top = min(top, y + y_off)
+                right = max(right, x + x_off + _width)
+                bottom = max(bottom, y + y_off + _height)
+
+            x += _cursor
+
+        # Clip the bounding box to the display, and check there is something
+        # to draw
+        left = max(left, 0)
+        top = max(top, 0)
+        right = min(right, self.width)
+        bottom = min(bottom, self.height)
+
+        if left >= right or top >= bottom:
+            self.cursor.x = x
+            return
+
+        block_width = right - left
+        block_height = bottom - top
+
+        # If the block is too large, draw each character in turn instead:
+        # but still as a single SPI transaction
+        if block_width * block_height * pixel_size > _TEXT_BLOCK_SIZE:
+            with self._cs_held:
+                super().write_text(txt_str, fg_colour=fg_colour, pen=pen)
+            return
+
+        # Copy the visible rows of each glyph into the block
+        block = bytearray(
+            bg_pixel.to_bytes(pixel_size, "big") * (block_width * block_height)
+        )
+
+        for character, glyph_x, glyph_y, _width, _height in glyphs:
+            glyph = memoryview(
+                self._cached_glyph(character, _width * _height, fg_pixel, bg_pixel)
             )
 
-        self._write(_DRAWRECT, data)
+            x_start = max(glyph_x, left)
+            x_end = min(glyph_x + _width, right)
+            row_bytes = (x_end - x_start) * pixel_size
+
+            if row_bytes <= 0:
+                continue
+
+            for row in range(max(glyph_y, top), min(glyph_y + _height, bottom)):
+                src = ((row - glyph_y) * _width + (x_start - glyph_x)) * pixel_size
+                dst = ((row - top) * block_width + (x_start - left)) * pixel_size
+                block[dst : dst + row_bytes] = glyph[src : src + row_bytes]
+
+        self._block(left, top, block_width, block_height, block)
+
+        # Keep the block for the next time the string is drawn, removing the
+        # least recently used blocks until it fits in the cache
+        while self._text_cache_used + len(block) > _TEXT_CACHE_SIZE:
+            oldest = self._text_cache.pop(next(iter(self._text_cache)))
+            self._text_cache_used -= len(oldest[4])
+
+        self._text_cache[text_key] = (left, top, block_width, block_height, block, x)
+        self._text_cache_used += len(block)
+
+        # Move the cursor to the end of the string. This is also where the
+        # next character should be drawn
+        self.cursor.x = x
+
+    def write_char(
+        self,
+        utf8_char: str,
+        start: Optional[tuple[int, int]] = None,
+        fg_colour: Optional[graphics.Colour] = None,
+        pen: Optional[graphics.Pen] = None,
+    ) -> None:
+        """Write a `utf8_char` character (using the current `font`) starting at
+        the pixel position (`x`, `y`) of the `cursor` in the specified `colour`.
+        See [`select_fg_colour`][lbutils.graphics.Canvas.select_fg_colour] for
+        more details of the colour selection algorithm.
+
+        Unlike the generic [`write_char`][lbutils.graphics.Canvas.write_char]
+        of the `Canvas`, the glyph is rendered as a complete block of pixels
+        and sent to the display in a single transfer. Rendered glyphs are kept
+        in a small least-recently used cache, keyed on the character, font and
+        colours, so redrawing the same text (e.g. labels or status lines) only
+        sends the cached pixels to the display.
+
+        !!! note
+            As the glyph is sent as a block, the pixels _not_ set by the glyph
+            are drawn in the background colour: see [`select_bg_colour`]
+            [lbutils.graphics.Canvas.select_bg_colour] for the details of how
+            that colour is chosen. Glyphs which do not fit entirely on the
+            display are clipped to the visible part of the glyph.
+
+        Parameters
+        ----------
+
+        utf8_char:
+            The character to write to the display.
+        start: tuple, optional
+             The (x, y) co-ordinate of the _start_ point of the character, with
+             the first value of the `tuple` representing the `x` co-ordinate and
+             the second value of the `tuple` representing the `y` co-ordinate. If
+             the `start` is `None`, the default, then the current value of the
+             [`cursor`][lbutils.graphics.Canvas.cursor] is used as the start
+             point of the character. Values beyond the first and second entries
+             of the `tuple` are ignored.
+        fg_colour: Type[graphics.Colour], optional
+            The [`Colour`][lbutils.graphics.Colour] to be used when drawing the
+            character. If not specified, use the preference order for the
+            foreground colour of the `Canvas` to find a suitable colour.
+        pen: Type[graphics.Pen], optional
+            The [`Pen`][lbutils.graphics.Pen] to be used when drawing the
+            character. If not specified, use the preference order for the
+            foreground and background colours of the `Canvas` to find suitable
+            colours.
+        """
+
+        # Work out the colours to use for the glyph
+        use_fg_colour = self.select_fg_colour(fg_colour=fg_colour, pen=pen)
+        use_bg_colour = self.select_bg_colour(pen=pen)
+
+        # If a `start` has been specified, then move the cursor to
+        # that co-ordinate. Otherwise we assume the cursor is in the
+        # right place
+        if start is not None:
+            self.cursor.x_y = start
+
+        # Get the parameters we need to draw the specified glyph in the
+        # current font
+        font = self.font
+        font.set_position(utf8_char)
+        _offset, _width, _height, _cursor, x_off, y_off = font.current_glyph
+
+        x = self.cursor.x + x_off
+        y = self.cursor.y + y_off
+
+        # Find the part of the glyph which is visible on the display. If
+        # there is nothing to draw, just move the cursor to the next glyph
+        x_start = max(x, 0)
+        y_start = max(y, 0)
+        x_end = min(x + _width, self.width)
+        y_end = min(y + _height, self.height)
+
+        if x_start >= x_end or y_start >= y_end:
+            self.cursor.x += _cursor
+            return
+
+        pack_colour = self._pack_colour
+        pixel_size = self._pixel_size
+
+        fg_pixel = pack_colour(
+            use_fg_colour.red, use_fg_colour.green, use_fg_colour.blue
+        )
+        bg_pixel = pack_colour(
+            use_bg_colour.red, use_bg_colour.green, use_bg_colour.blue
+        )
+
+        glyph: Union[bytearray, memoryview] = self._cached_glyph(
+            utf8_char, _width * _height, fg_pixel, bg_pixel
+        )
+
+        # Draw the glyph at the current cursor position. If the glyph has only
+        # been clipped by the top or bottom of the display, the visible rows
+        # can be sent directly from the glyph: otherwise copy the visible part
+        # of each row
+        if x_start != x or x_end != x + _width:
+            row_bytes = (x_end - x_start) * pixel_size
+            clipped = bytearray(row_bytes * (y_end - y_start))
+            source = memoryview(glyph)
+
+            for row in range(y_end - y_start):
+                src = ((y_start - y + row) * _width + (x_start - x)) * pixel_size
+                clipped[row * row_bytes : (row + 1) * row_bytes] = source[
+                    src : src + row_bytes
+                ]
+
+            glyph = clipped
+        elif y_start != y or y_end != y + _height:
+            row_bytes = _width * pixel_size
+            glyph = memoryview(glyph)[
+                (y_start - y) * row_bytes : (y_end - y) * row_bytes
+            ]
+
+        self._block(x_start, y_start, x_end - x_start, y_end - y_start, glyph)
+
+        # Move the cursor to the `x` position at the end of the glyph.
+        # This is also where the next character should be drawn
+        self.cursor.x += _cursor
+
+    def begin_batch(self) -> None:
+        """Start collecting the commands of the following drawing primitives,
+        instead of sending each command to the display driver as it is made.
+        The collected commands are sent in a single SPI transaction by
+        `end_batch`, saving the set-up of a transaction for each command when
+        many primitives (e.g. rectangles or lines) are drawn together.
+
+        Any drawing primitive which sends pixel data, or reads from the
+        display, first sends the commands collected so far: so the drawing
+        order is always preserved. Calling `begin_batch` whilst a batch is
+        already open has no effect.
+        """
+        if self._batch is None:
+            self._batch = bytearray()
+
+    def end_batch(self) -> None:
+        """Send all the commands collected since the call to `begin_batch` to
+        the display driver, and return to sending each command as it is made.
+        Calling `end_batch` when no batch is open has no effect."""
+        batch = self._batch
+        self._batch = None
+
+        if batch:
+            self._write_commands(batch)
+
+    def fill_screen(self, bg_colour: Optional[graphics.Colour] = None) -> None:
+        """Fill the entire display with the specified colour. By default this
+        will use the colour preference order to find a background colour if
+        `bg_colour` is `None`. See [`select_bg_colour`]
+        [lbutils.graphics.Canvas.select_bg_colour] for more details of the
+        background colour selection algorithm.
+
+        Unlike the generic [`fill_screen`][lbutils.graphics.Canvas.fill_screen]
+        of the `Canvas`, the packed rectangle command is cached for the last
+        colour used, and the command to clear the display to black is built
+        once when the display is created. Repeatedly clearing the display to
+        the same colour (e.g. once per frame) therefore only sends the cached
+        command to the display.
+
+        Parameters
+        ----------
+
+        bg_colour: Type[graphics.Colour], optional
+             The [`Colour`][lbutils.graphics.Colour] to be used to fill the
+             screen. Defaults to using the colour search order of the `Canvas`
+             to find a colour.
+        """
+        fill_colour = self.select_bg_colour(bg_colour=bg_colour)
+
+        # Key the cached command on the channels written to the display,
+        # which (unlike `as_rgb565`) do not depend on the `word_order` of the
+        # colour
+        fill_key = _colour_channels(fill_colour)
+
+        # Black has a pre-built command of its own
+        if fill_key == (0, 0, 0):
+            self._draw_rect(self._black_fill_buf)
+            return
+
+        # Only re-build the colours of the rectangle command if the fill
+        # colour has changed
+        fill_buf = self._fill_buf
+
+        if fill_key != self._fill_key:
+            fill_red, fill_green, fill_blue = fill_key
+
+            fill_buf[7] = fill_red
+            fill_buf[8] = fill_green
+            fill_buf[9] = fill_blue
+            fill_buf[10] = fill_red
+            fill_buf[11] = fill_green
+            fill_buf[12] = fill_blue
+
+            self._fill_key = fill_key
+
+        self._draw_rect(fill_buf)
 
     def reset(self) -> None:
-        """Reset the display, clearing the current contents."""
+        """Reset the display, clearing the current contents. As the reset also
+        clears the configuration of the display driver, the initialisation
+        sequence is sent again once the reset is complete."""
         if self.reset_pin is not None:
-            self.reset_pin.value(0)
-            utime.sleep(0.1)
-            self.reset_pin.value(1)
+            # Send any collected commands before they are lost by the reset
+            if self._batch is not None:
+                self._flush_batch()
+
+            reset_value = self.reset_pin.value
+            reset_value(0)
+            utime.sleep_ms(100)
+            reset_value(1)
+
+            self._write_init()
+            self._write_cmd(_DISPLAYON)
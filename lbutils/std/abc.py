@@ -34,12 +34,10 @@ except ImportError:
     from lbutils.std.typing import Any
 
 
-class ABCMeta:
-    pass
-
-
-class ABC:
-    pass
+# As abstract classes are not enforced, alias the base types directly: so
+# sub-classes of `ABC` do not carry an empty class in their MRO
+ABCMeta = type
+ABC = object
 
 
 def abstractmethod(f: Any) -> Any:
@@ -0,0 +1,12 @@
+# MicroPython manifest for the `lbutils` library. Including this manifest
+# when building the firmware freezes the library into flash as pre-compiled
+# bytecode: avoiding the cost of parsing the modules at import, and the RAM
+# used by the module source. The `opt=3` level also strips the docstrings
+# and assertions from the frozen bytecode. See
+#
+#   https://docs.micropython.org/en/latest/reference/manifest.html
+#
+# for details of the manifest format, and the 'Set-up the Pico H/W' how-to
+# guide for the details of how to use this manifest.
+
+package("lbutils", opt=3)  # noqa: F821
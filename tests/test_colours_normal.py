@@ -23,217 +23,74 @@ colour conversion routines of the `Colour` class.
 
 !!! note
 
-Binary strings are used in the checks of the bit values to make it easier to
-locate stray and incorrect bits. If a test fails, `pytest` should report the
-correct binary representation, and the one received from the method.
+Binary strings are used in the failure messages of the checks to make it
+easier to locate stray and incorrect bits. If a test fails, `pytest` should
+report the correct binary representation, and the one received from the method.
 
 Run as: `py.test test_colours_normal.py`
 """
 
-from lbutils.graphics.colours import DEVICE_WORD_ORDER, Colour
-
-
-def test_colour_white_565_normal():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    255 and Blue = 255 gives the correct RGB565 response for the normal bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFF
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 255, 255, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "1111111111111111"
-    assert colour.as_rgb565 == 0xFFFF
-
-
-def test_colour_white_888_normal():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    255 and Blue = 255 gives the correct RGB888 response for the normal bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFFFFFF
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 255, 255, word_order=DEVICE_WORD_ORDER.NORMAL)
-
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "111111111111111111111111"
-    assert colour.as_rgb888 == 0xFFFFFF
-
-
-def test_colour_black_565_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 0 gives the correct RGB565 response for the normal bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0000000000000000"
-    assert colour.as_rgb565 == 0x0
-
-
-def test_colour_black_888_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 0 gives the correct RGB888 response for the normal bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
-
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "000000000000000000000000"
-    assert colour.as_rgb888 == 0x0
-
+from itertools import product
 
-def test_colour_red_565_normal():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    0 and Blue = 0 gives the correct RGB565 response for the normal bit order.
+import pytest
 
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xF8
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 0, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "1111100000000000"
-    assert colour.as_rgb565 == 0xF800
-
-
-def test_colour_red_888_normal():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    0 and Blue = 0 gives the correct RGB888 response for the normal bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFF0000
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 0, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
-
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "111111110000000000000000"
-    assert colour.as_rgb888 == 0xFF0000
-
-
-def test_colour_green_565_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB565 response for the normal bit order.
-
-    Expectation
-    -----------
+from lbutils.graphics.colours import DEVICE_WORD_ORDER, Colour
 
-    **Pass**: Return value is 0x7E0
+##
+## Test Cases. Each case gives the `r`, `g` and `b` components of the colour,
+## followed by the expected RGB565 and RGB888 values for the normal order
+##
 
-    On-Failure
-    ----------
+COLOUR_CASES = [
+    pytest.param((255, 255, 255, 0xFFFF, 0xFFFFFF), id="white"),
+    pytest.param((0, 0, 0, 0x0, 0x0), id="black"),
+    pytest.param((255, 0, 0, 0xF800, 0xFF0000), id="red"),
+    pytest.param((0, 255, 0, 0x07E0, 0x00FF00), id="green"),
+    pytest.param((0, 0, 255, 0x001F, 0x0000FF), id="blue"),
+    pytest.param((61, 41, 108, 0x394D, 0x3D296C), id="beckett"),
+]
 
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 255, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0000011111100000"
-    assert colour.as_rgb565 == 0x07E0
+##
+## Reference Values. The components of the colour grid used by the reference
+## tests, stepping from `0` to `255` inclusive
+##
 
+GRID_STEPS = range(0, 256, 17)
 
-def test_colour_green_888_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB888 response for the normal bit order.
 
-    Expectation
-    -----------
+def _reference_565(r: int, g: int, b: int) -> int:
+    """Return the RGB565 value of the components `r`, `g` and `b`, by keeping
+    the top 5, 6 and 5 bits of each component in turn."""
+    return (r >> 3) << 11 | (g >> 2) << 5 | (b >> 3)
 
-    **Pass**: Return value is 0x00FF00
 
-    On-Failure
-    ----------
+##
+## Fixtures
+##
 
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 255, 0, word_order=DEVICE_WORD_ORDER.NORMAL)
 
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "000000001111111100000000"
-    assert colour.as_rgb888 == 0x00FF00
+@pytest.fixture(scope="module", params=COLOUR_CASES)
+def colour_case(request: pytest.FixtureRequest) -> tuple[Colour, int, int]:
+    """Return the `Colour` for each of the `COLOUR_CASES`, along with the
+    expected RGB565 and RGB888 values. The `Colour` is created once for each
+    case, and shared by the RGB565 and RGB888 tests."""
+    r, g, b, rgb565, rgb888 = request.param
+    return Colour(r, g, b, word_order=DEVICE_WORD_ORDER.NORMAL), rgb565, rgb888
 
 
-def test_colour_blue_565_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 255 gives the correct RGB565 response for the normal bit order.
+##
+## Tests
+##
 
-    Expectation
-    -----------
 
-    **Pass**: Return value is 0x7E0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 255, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0000000000011111"
-    assert colour.as_rgb565 == 0x001F
-
-
-def test_colour_blue_888_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 255 gives the correct RGB888 response for the normal bit order.
+def test_colour_565_normal(colour_case: tuple[Colour, int, int]) -> None:
+    """Test that initialising the `Colour` class with the components of the
+    `colour_case` gives the correct RGB565 response for the normal bit order.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x0000FF
+    **Pass**: Return value is the expected RGB565 value of the `colour_case`
 
     On-Failure
     ----------
@@ -241,20 +98,18 @@ def test_colour_blue_888_normal():
       * Check the platform byte ordering has been correctly determined
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(0, 0, 255, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "000000000000000011111111"
-    assert colour.as_rgb888 == 0x0000FF
+    colour, rgb565, _rgb888 = colour_case
+    assert colour.as_rgb565 == rgb565, f"{colour.as_rgb565:016b} != {rgb565:016b}"
 
 
-def test_colour_beckett_565_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB565 response for the normal bit order.
+def test_colour_888_normal(colour_case: tuple[Colour, int, int]) -> None:
+    """Test that initialising the `Colour` class with the components of the
+    `colour_case` gives the correct RGB888 response for the normal bit order.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x7E0
+    **Pass**: Return value is the expected RGB888 value of the `colour_case`
 
     On-Failure
     ----------
@@ -262,29 +117,27 @@ def test_colour_beckett_565_normal():
       * Check the platform byte ordering has been correctly determined
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(61, 41, 108, word_order=DEVICE_WORD_ORDER.NORMAL)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0011100101001101"
-    assert colour.as_rgb565 == 0x394D
+    colour, _rgb565, rgb888 = colour_case
+    assert colour.as_rgb888 == rgb888, f"{colour.as_rgb888:024b} != {rgb888:024b}"
 
 
-def test_colour_beckett_888_normal():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB888 response for the normal bit order.
+def test_colour_565_normal_grid() -> None:
+    """Test that initialising the `Colour` class with each of the components
+    on a coarse grid of `GRID_STEPS` gives the same RGB565 response as the
+    reference conversion for the normal bit order.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x3D296C
+    **Pass**: Return value matches `_reference_565` for all 4096 colours
 
     On-Failure
     ----------
 
-      * Check the platform byte ordering has been correctly determined
+      * Check the components reported in the failure message
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(61, 41, 108, word_order=DEVICE_WORD_ORDER.NORMAL)
-
-    bin_string = f"{colour.as_rgb888:024b}"
-    assert bin_string == "001111010010100101101100"
-    assert colour.as_rgb888 == 0x3D296C
+    for r, g, b in product(GRID_STEPS, repeat=3):
+        rgb565 = Colour(r, g, b, word_order=DEVICE_WORD_ORDER.NORMAL).as_rgb565
+        expected = _reference_565(r, g, b)
+        assert rgb565 == expected, f"({r}, {g}, {b}): {rgb565:016b} != {expected:016b}"
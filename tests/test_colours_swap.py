@@ -23,217 +23,76 @@ colour conversion routines of the `Colour` class.
 
 !!! note
 
-Binary strings are used in the checks of the bit values to make it easier to
-locate stray and incorrect bits. If a test fails, `pytest` should report the
-correct binary representation, and the one received from the method.
+Binary strings are used in the failure messages of the checks to make it
+easier to locate stray and incorrect bits. If a test fails, `pytest` should
+report the correct binary representation, and the one received from the method.
 
 Run as: `py.test test_colours_swap.py`
 """
 
-from lbutils.graphics.colours import DEVICE_WORD_ORDER, Colour
-
-
-def test_colour_white_565_swap():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    255 and Blue = 255 gives the correct RGB565 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFF
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 255, 255, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "1111111111111111"
-    assert colour.as_rgb565 == 0xFFFF
-
-
-def test_colour_white_888_swap():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    255 and Blue = 255 gives the correct RGB888 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFFFFFF
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 255, 255, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "11111111000000001111111111111111"
-    assert colour.as_rgb888 == 0xFF00FFFF
-
-
-def test_colour_black_565_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 0 gives the correct RGB565 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0000000000000000"
-    assert colour.as_rgb565 == 0x0
-
-
-def test_colour_black_888_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 0 gives the correct RGB888 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "00000000000000000000000000000000"
-    assert colour.as_rgb888 == 0x0
-
+from itertools import product
 
-def test_colour_red_565_swap():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    0 and Blue = 0 gives the correct RGB565 response for the byte swapped bit order.
+import pytest
 
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xF8
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 0, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0000000011111000"
-    assert colour.as_rgb565 == 0x00F8
-
-
-def test_colour_red_888_swap():
-    """Test that initialising the `Colour` class with Red = 255, Green =
-    0 and Blue = 0 gives the correct RGB888 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0xFF0000
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(255, 0, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "11111111000000000000000000000000"
-    assert colour.as_rgb888 == 0xFF000000
-
-
-def test_colour_green_565_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB565 response for the byte swapped bit order.
-
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x7E0
-
-    On-Failure
-    ----------
-
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 255, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "1110000000000111"
-    assert colour.as_rgb565 == 0xE007
+from lbutils.graphics.colours import DEVICE_WORD_ORDER, Colour
 
+##
+## Test Cases. Each case gives the `r`, `g` and `b` components of the colour,
+## followed by the expected RGB565 and RGB888 values for the byte swapped
+## order
+##
 
-def test_colour_green_888_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB888 response for the byte swapped bit order.
+COLOUR_CASES = [
+    pytest.param((255, 255, 255, 0xFFFF, 0xFF00FFFF), id="white"),
+    pytest.param((0, 0, 0, 0x0, 0x0), id="black"),
+    pytest.param((255, 0, 0, 0x00F8, 0xFF000000), id="red"),
+    pytest.param((0, 255, 0, 0xE007, 0x0000FF), id="green"),
+    pytest.param((0, 0, 255, 0x1F00, 0x0000FF00), id="blue"),
+    pytest.param((61, 41, 108, 0x4D39, 0x3D006C29), id="beckett"),
+]
 
-    Expectation
-    -----------
-
-    **Pass**: Return value is 0x00FF00
+##
+## Reference Values. The components of the colour grid used by the property
+## tests, stepping from `0` to `255` inclusive
+##
 
-    On-Failure
-    ----------
+GRID_STEPS = range(0, 256, 17)
 
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 255, 0, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
 
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "00000000000000000000000011111111"
-    assert colour.as_rgb888 == 0x0000FF
+def _reference_565(r: int, g: int, b: int) -> int:
+    """Return the RGB565 value of the components `r`, `g` and `b` for the
+    normal order, by keeping the top 5, 6 and 5 bits of each component in
+    turn."""
+    return (r >> 3) << 11 | (g >> 2) << 5 | (b >> 3)
 
 
-def test_colour_blue_565_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 255 gives the correct RGB565 response for the byte swapped bit order.
+##
+## Fixtures
+##
 
-    Expectation
-    -----------
 
-    **Pass**: Return value is 0x1F00
+@pytest.fixture(scope="module", params=COLOUR_CASES)
+def colour_case(request: pytest.FixtureRequest) -> tuple[Colour, int, int]:
+    """Return the `Colour` for each of the `COLOUR_CASES`, along with the
+    expected RGB565 and RGB888 values. The `Colour` is created once for each
+    case, and shared by the RGB565 and RGB888 tests."""
+    r, g, b, rgb565, rgb888 = request.param
+    return Colour(r, g, b, word_order=DEVICE_WORD_ORDER.SWAP_BYTES), rgb565, rgb888
 
-    On-Failure
-    ----------
 
-      * Check the platform byte ordering has been correctly determined
-      * Check the bit pattern returned against the expected in the method docstring
-    """
-    colour = Colour(0, 0, 255, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0001111100000000"
-    assert colour.as_rgb565 == 0x1F00
+##
+## Tests
+##
 
 
-def test_colour_blue_888_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    0 and Blue = 255 gives the correct RGB888 response for the byte swapped bit order.
+def test_colour_565_swap(colour_case: tuple[Colour, int, int]) -> None:
+    """Test that initialising the `Colour` class with the components of the
+    `colour_case` gives the correct RGB565 response for the byte swapped bit order.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x0000FF
+    **Pass**: Return value is the expected RGB565 value of the `colour_case`
 
     On-Failure
     ----------
@@ -241,21 +100,18 @@ def test_colour_blue_888_swap():
       * Check the platform byte ordering has been correctly determined
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(0, 0, 255, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
+    colour, rgb565, _rgb888 = colour_case
+    assert colour.as_rgb565 == rgb565, f"{colour.as_rgb565:016b} != {rgb565:016b}"
 
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "00000000000000001111111100000000"
-    assert colour.as_rgb888 == 0x0000FF00
 
-
-def test_colour_beckett_565_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB565 response for the byte swapped bit order.
+def test_colour_888_swap(colour_case: tuple[Colour, int, int]) -> None:
+    """Test that initialising the `Colour` class with the components of the
+    `colour_case` gives the correct RGB888 response for the byte swapped bit order.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x4D39
+    **Pass**: Return value is the expected RGB888 value of the `colour_case`
 
     On-Failure
     ----------
@@ -263,29 +119,36 @@ def test_colour_beckett_565_swap():
       * Check the platform byte ordering has been correctly determined
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(61, 41, 108, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-    bin_string = f"{colour.as_rgb565:016b}"
-    assert bin_string == "0100110100111001"
-    assert colour.as_rgb565 == 0x4D39
+    colour, _rgb565, rgb888 = colour_case
+    assert colour.as_rgb888 == rgb888, f"{colour.as_rgb888:032b} != {rgb888:032b}"
 
 
-def test_colour_beckett_888_swap():
-    """Test that initialising the `Colour` class with Red = 0, Green =
-    255 and Blue = 0 gives the correct RGB888 response for the byte swapped bit order.
+def test_colour_swap_grid() -> None:
+    """Test that for each colour on a coarse grid of `GRID_STEPS`, the byte
+    swapped RGB565 and RGB888 values of the `Colour` class are the reference
+    values for the normal order with the bytes of each word exchanged.
 
     Expectation
     -----------
 
-    **Pass**: Return value is 0x3D296C
+    **Pass**: The swapped and reference values agree for all 4096 colours
 
     On-Failure
     ----------
 
-      * Check the platform byte ordering has been correctly determined
+      * Check the components reported in the failure message
       * Check the bit pattern returned against the expected in the method docstring
     """
-    colour = Colour(61, 41, 108, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
-
-    bin_string = f"{colour.as_rgb888:032b}"
-    assert bin_string == "00111101000000000110110000101001"
-    assert colour.as_rgb888 == 0x3D006C29
+    for r, g, b in product(GRID_STEPS, repeat=3):
+        swap = Colour(r, g, b, word_order=DEVICE_WORD_ORDER.SWAP_BYTES)
+
+        rgb565 = swap.as_rgb565
+        reference = _reference_565(r, g, b)
+        expected = (reference & 0xFF) << 8 | reference >> 8
+        assert rgb565 == expected, f"({r}, {g}, {b}): {rgb565:016b} != {expected:016b}"
+
+        # The normal RGB888 word pair is `0x00RR`, `0xGGBB`: and so swapping the
+        # bytes of each word gives `0xRR00`, `0xBBGG`
+        rgb888 = swap.as_rgb888
+        expected = r << 24 | b << 8 | g
+        assert rgb888 == expected, f"({r}, {g}, {b}): {rgb888:032b} != {expected:032b}"
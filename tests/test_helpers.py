@@ -0,0 +1,281 @@
+# This module, and all included code, is made available under the terms of the MIT Licence
+#
+# Copyright (c) 2023 David Love
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal in
+# the Software without restriction, including without limitation the rights to
+# use, copy, modify, merge, publish, distribute, sublicense, and/or sell copies of
+# the Software, and to permit persons to whom the Software is furnished to do so,
+# subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS
+# FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR
+# COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER
+# IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN
+# CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""Tests of the `helpers` module, checking the conversion of co-ordinates to
+integers, the cached Polar co-ordinate sweep of the `Pixel` class against the
+trigonometric calculation it replaces, and the clamping of co-ordinates by the
+`BoundPixel` class.
+
+Run as: `py.test test_helpers.py`
+"""
+
+from math import cos, pi, sin
+
+import pytest
+
+from lbutils.graphics import helpers
+from lbutils.graphics.helpers import BoundPixel, Pixel, _toint
+
+##
+## Test Cases. Each case gives the value passed to `_toint`, followed by the
+## expected integer value
+##
+
+TOINT_CASES = [
+    pytest.param(0, 0, id="zero"),
+    pytest.param(17, 17, id="positive"),
+    pytest.param(-17, -17, id="negative"),
+    pytest.param(17.9, 17, id="float"),
+    pytest.param(-17.9, -17, id="float-negative"),
+    pytest.param(True, 1, id="bool"),
+]
+
+##
+## Test Cases. The origin, radius and angles used by the sweep tests
+##
+
+SWEEP_ORIGIN = (20, 30)
+SWEEP_RADII = (0, 1, 7, 64)
+SWEEP_THETAS = tuple(step * pi / 12 for step in range(24))
+
+##
+## Test Cases. Each case gives the value written to the `x` and `y` co-ordinates
+## of a `BoundPixel` limited to `BOUND_MIN` and `BOUND_MAX`, followed by the
+## expected value of the co-ordinate
+##
+
+BOUND_MIN = 5
+BOUND_MAX = 95
+
+BOUND_CASES = [
+    pytest.param(-10, BOUND_MIN, id="below"),
+    pytest.param(BOUND_MIN, BOUND_MIN, id="lower"),
+    pytest.param(50, 50, id="inside"),
+    pytest.param(BOUND_MAX, BOUND_MAX, id="upper"),
+    pytest.param(200, BOUND_MAX, id="above"),
+    pytest.param(42.9, 42, id="float"),
+    pytest.param(2.5, BOUND_MIN, id="float-below"),
+    pytest.param(95.7, BOUND_MAX, id="float-upper"),
+]
+
+##
+## Reference Values
+##
+
+
+def _reference_sweep(x: int, y: int, r: int, thetas: tuple) -> list:
+    """Return the (x, y) co-ordinates of the sweep of radius `r` about
+    `(x, y)`, calculating the sine and cosine of each angle in `thetas` in
+    turn."""
+    return [(int(x + (r * cos(theta))), int(y + (r * sin(theta)))) for theta in thetas]
+
+
+##
+## Tests
+##
+
+
+@pytest.mark.parametrize(("value", "expected"), TOINT_CASES)
+def test_toint(value: float, expected: int) -> None:
+    """Test that `_toint` returns `value` as an `int`, truncating float values
+    towards zero in the same way as `int()`.
+
+    Expectation
+    -----------
+
+    **Pass**: Return value is the `expected` value, with the type `int`
+
+    On-Failure
+    ----------
+
+      * Check that only values which are exactly of type `int` are returned
+        unchanged
+    """
+    result = _toint(value)
+
+    assert result == expected
+    assert type(result) is int
+
+
+def test_pixel_float_coordinates() -> None:
+    """Test that the co-ordinates of a `Pixel` are truncated to integers when
+    created from, or written with, float values.
+
+    Expectation
+    -----------
+
+    **Pass**: Co-ordinates are the truncated integer values
+
+    On-Failure
+    ----------
+
+      * Check the `x` and `y` setters call `_toint`
+    """
+    point = Pixel(3.7, 4.2)
+    assert (point.x, point.y) == (3, 4)
+
+    point.x = 10.9
+    point.y = -2.5
+    assert (point.x, point.y) == (10, -2)
+    assert type(point.x) is int
+    assert type(point.y) is int
+
+
+def test_sweep_polar_matches_trig() -> None:
+    """Test that `Pixel.sweep_polar` returns the same co-ordinates as the
+    direct trigonometric calculation, for each of the `SWEEP_RADII`.
+
+    Expectation
+    -----------
+
+    **Pass**: Co-ordinates match `_reference_sweep` for every angle and radius
+
+    On-Failure
+    ----------
+
+      * Check the order of the (cosine, sine) pairs in the look-up table
+      * Check the rounding of the co-ordinates against `offset_polar`
+    """
+    x, y = SWEEP_ORIGIN
+    origin = Pixel(x, y)
+
+    for r in SWEEP_RADII:
+        sweep = list(origin.sweep_polar(r, SWEEP_THETAS))
+        assert sweep == _reference_sweep(x, y, r, SWEEP_THETAS), f"r = {r}"
+
+
+def test_sweep_polar_matches_offset_polar() -> None:
+    """Test that `Pixel.sweep_polar` returns the same co-ordinate as
+    `Pixel.offset_polar` for each angle of the sweep.
+
+    Expectation
+    -----------
+
+    **Pass**: Each co-ordinate of the sweep matches `offset_polar`
+
+    On-Failure
+    ----------
+
+      * Check the order of the (cosine, sine) pairs in the look-up table
+    """
+    origin = Pixel(*SWEEP_ORIGIN)
+    sweep = origin.sweep_polar(13, SWEEP_THETAS)
+
+    for theta, point in zip(SWEEP_THETAS, sweep):
+        assert point == origin.offset_polar(13, theta), f"theta = {theta}"
+
+
+def test_sweep_polar_cache_bounded() -> None:
+    """Test that sweeping over more distinct tuples of angles than the cache
+    holds does not grow the look-up table cache beyond its limit, and that
+    the results remain correct after the cache is cleared.
+
+    Expectation
+    -----------
+
+    **Pass**: Cache never exceeds `_SWEEP_LUT_CACHE_SIZE` entries
+
+    On-Failure
+    ----------
+
+      * Check the cache is cleared before a new table is added
+    """
+    x, y = SWEEP_ORIGIN
+    origin = Pixel(x, y)
+
+    for offset in range(4 * helpers._SWEEP_LUT_CACHE_SIZE):
+        thetas = tuple(theta + offset for theta in SWEEP_THETAS)
+        sweep = list(origin.sweep_polar(10, thetas))
+
+        assert len(helpers._SWEEP_LUTS) <= helpers._SWEEP_LUT_CACHE_SIZE
+        assert sweep == _reference_sweep(x, y, 10, thetas), f"offset = {offset}"
+
+
+@pytest.mark.parametrize(("value", "expected"), BOUND_CASES)
+def test_bound_pixel_x(value: float, expected: int) -> None:
+    """Test that writing `value` to the `x` co-ordinate of a `BoundPixel`
+    truncates the value to an integer, and clamps it between the limits.
+
+    Expectation
+    -----------
+
+    **Pass**: Co-ordinate is the `expected` integer value
+
+    On-Failure
+    ----------
+
+      * Check the order of the `min` and `max` calls in the setter
+      * Check that float values are truncated before the limits are applied
+    """
+    point = BoundPixel(50, 50, max_x=BOUND_MAX, max_y=BOUND_MAX, min_x=BOUND_MIN)
+    point.x = value
+
+    assert point.x == expected
+    assert type(point.x) is int
+
+
+@pytest.mark.parametrize(("value", "expected"), BOUND_CASES)
+def test_bound_pixel_y(value: float, expected: int) -> None:
+    """Test that writing `value` to the `y` co-ordinate of a `BoundPixel`
+    truncates the value to an integer, and clamps it between the limits.
+
+    Expectation
+    -----------
+
+    **Pass**: Co-ordinate is the `expected` integer value
+
+    On-Failure
+    ----------
+
+      * Check the order of the `min` and `max` calls in the setter
+      * Check that float values are truncated before the limits are applied
+    """
+    point = BoundPixel(50, 50, max_x=BOUND_MAX, max_y=BOUND_MAX, min_y=BOUND_MIN)
+    point.y = value
+
+    assert point.y == expected
+    assert type(point.y) is int
+
+
+@pytest.mark.parametrize(("value", "expected"), BOUND_CASES)
+def test_bound_pixel_init(value: float, expected: int) -> None:
+    """Test that the initial co-ordinates of a `BoundPixel` are truncated and
+    clamped in the same way as later writes to the co-ordinates.
+
+    Expectation
+    -----------
+
+    **Pass**: Both co-ordinates are the `expected` integer value
+
+    On-Failure
+    ----------
+
+      * Check the limits are set before the initial co-ordinates are written
+    """
+    point = BoundPixel(
+        value,
+        value,
+        max_x=BOUND_MAX,
+        max_y=BOUND_MAX,
+        min_x=BOUND_MIN,
+        min_y=BOUND_MIN,
+    )
+
+    assert (point.x, point.y) == (expected, expected)